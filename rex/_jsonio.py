@@ -0,0 +1,65 @@
+"""JSON parsing and serialization shared by the json and yaml command groups.
+
+orjson is used when installed; the stdlib json module decides whenever
+orjson rejects a document. Non-finite numbers (NaN, Infinity, and literals
+such as 1e400 that overflow) are parsed as NonFinite, which orjson refuses
+to serialize, so they are written back as NaN/Infinity by the stdlib.
+
+Floats written by orjson use the shortest exponent form (1e16, 1e-7) where
+the stdlib writes 1e+16 and 1e-07; both parse back to the same value.
+"""
+
+import json
+import math
+import re
+from typing import Optional
+
+try:
+    # Rust-backed parser and serializer; the stdlib json module is used without it
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson reads integers outside the int64/uint64 range as floats; documents
+# with a run of this many digits (the shortest such literal, -2**63 - 1, has
+# 19) are left to the stdlib parser, which keeps them exact
+_LONG_NUMBER = re.compile(rb"[0-9]{19}")
+
+
+class NonFinite(float):
+    """NaN/Infinity from the input; orjson refuses to serialize it, so output falls back to the stdlib."""
+
+
+def loads(raw: bytes, parse_constant=NonFinite):
+    """Parse JSON, raising json.JSONDecodeError on invalid input."""
+    if orjson is not None and not _LONG_NUMBER.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects some documents the stdlib accepts (NaN, integers
+            # beyond 64 bits), so let the stdlib have the final say
+            pass
+    def parse_float(text: str) -> float:
+        # Literals such as 1e400 overflow to inf and are treated like Infinity
+        value = float(text)
+        return value if math.isfinite(value) else parse_constant(text)
+
+    return json.loads(raw, parse_float=parse_float, parse_constant=parse_constant)
+
+
+def dumpb(parsed, indent: Optional[int] = None, sort_keys: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, pretty-printed when indent is given and minified otherwise."""
+    if orjson is not None and indent in (None, 2):
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return orjson.dumps(parsed, option=option)
+        except orjson.JSONEncodeError:
+            pass
+    if indent is None:
+        return json.dumps(parsed, separators=(",", ":"), sort_keys=sort_keys, ensure_ascii=False).encode()
+    return json.dumps(parsed, indent=indent, sort_keys=sort_keys, ensure_ascii=False).encode()
+
+
+def dumps(parsed, indent: Optional[int] = None, sort_keys: bool = False) -> str:
+    """Serialize to JSON text for display; files should be written from dumpb()."""
+    return dumpb(parsed, indent=indent, sort_keys=sort_keys).decode()
@@ -0,0 +1,50 @@
+"""Terminal output shared by every command group."""
+
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console, RenderableType
+
+
+class _LazyConsole:
+    """Stands in for rich's Console and only imports and creates it on first use.
+
+    Commands that print plain values (`--raw`, `--output`) or exit early never
+    load Rich at all.
+    """
+
+    _console: "Console | None" = None
+
+    def __getattr__(self, name: str):
+        if self._console is None:
+            from rich.console import Console
+
+            type(self)._console = Console()
+        return getattr(self._console, name)
+
+
+console = _LazyConsole()
+
+# REX_PLAIN=1 turns off syntax highlighting for JSON/YAML output everywhere
+PLAIN = os.environ.get("REX_PLAIN", "") not in ("", "0")
+# Longer code is shown plain; Pygments tokenizing would dominate rendering
+HIGHLIGHT_LIMIT = 64 * 1024
+
+
+def code_view(code: str, lexer: str, line_numbers: bool = False, highlight: bool = True) -> "RenderableType":
+    """Render code with syntax highlighting, or as plain text when highlighting is off.
+
+    Highlighting runs Pygments over the whole text, which dominates rendering
+    for large documents; plain text skips it (and is never parsed as markup).
+    It is also skipped past HIGHLIGHT_LIMIT characters and when output is not
+    a terminal, where the colors would be dropped anyway.
+    """
+    if PLAIN or not highlight or len(code) > HIGHLIGHT_LIMIT or not console.is_terminal:
+        from rich.text import Text
+
+        return Text(code)
+    # Imported here so commands that never highlight don't load Pygments
+    from rich.syntax import Syntax
+
+    return Syntax(code, lexer, theme="monokai", line_numbers=line_numbers, background_color="default")
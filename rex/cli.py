@@ -1,52 +1,66 @@
 """Rex CLI — Main entry point."""
 
+import importlib
+
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich import box
+from typer.core import TyperGroup
 
 from rex import __version__
-from rex.commands import (
-    encrypt_cmd,
-    json_cmd,
-    yaml_cmd,
-    password_cmd,
-    cron_cmd,
-    hash_cmd,
-    base64_cmd,
-    jwt_cmd,
-    uuid_cmd,
-    cert_cmd,
-    network_cmd,
-)
+from rex._ui import console
+
+# Command groups: name -> (module in rex.commands, help text)
+COMMAND_GROUPS = {
+    "encrypt": ("encrypt_cmd", "🔐 Encrypt & decrypt data (AES-256, ChaCha20, Fernet)"),
+    "json": ("json_cmd", "📋 JSON beautify, minify, validate & query"),
+    "yaml": ("yaml_cmd", "📄 YAML lint, validate & convert"),
+    "password": ("password_cmd", "🔑 Generate secure passwords & passphrases"),
+    "cron": ("cron_cmd", "⏰ Generate & explain cron expressions"),
+    "hash": ("hash_cmd", "🔒 Generate hashes (MD5, SHA, BLAKE2, HMAC)"),
+    "base64": ("base64_cmd", "📦 Base64 encode & decode"),
+    "jwt": ("jwt_cmd", "🎫 Decode & inspect JWT tokens"),
+    "uuid": ("uuid_cmd", "🆔 Generate UUIDs (v1, v4, v5)"),
+    "cert": ("cert_cmd", "📜 Inspect SSL/TLS certificates"),
+    "net": ("network_cmd", "🌐 Network utilities (DNS, ping, port check)"),
+}
+
+
+class LazyGroup(TyperGroup):
+    """Root group that imports a command module only when its group is used.
+
+    `rex hash ...` no longer pays for importing cryptography, PyYAML, ssl and
+    the other command modules; only `--help` and completion load them all.
+    """
+
+    def list_commands(self, ctx) -> list[str]:
+        return [*super().list_commands(ctx), *(name for name in COMMAND_GROUPS if name not in self.commands)]
+
+    def get_command(self, ctx, cmd_name: str):
+        if cmd_name not in self.commands and cmd_name in COMMAND_GROUPS:
+            module_name, help_text = COMMAND_GROUPS[cmd_name]
+            module = importlib.import_module(f"rex.commands.{module_name}")
+            group = typer.main.get_group(module.app)
+            group.name = cmd_name
+            group.help = help_text
+            self.add_command(group, cmd_name)
+        return super().get_command(ctx, cmd_name)
 
-console = Console()
 
 app = typer.Typer(
     name="rex",
+    cls=LazyGroup,
     help="🦖 Rex — A Swiss Army Knife CLI for DevOps Engineers",
     add_completion=True,
     no_args_is_help=True,
     rich_markup_mode="rich",
 )
 
-# Register command groups
-app.add_typer(encrypt_cmd.app, name="encrypt", help="🔐 Encrypt & decrypt data (AES-256, ChaCha20, Fernet)")
-app.add_typer(json_cmd.app, name="json", help="📋 JSON beautify, minify, validate & query")
-app.add_typer(yaml_cmd.app, name="yaml", help="📄 YAML lint, validate & convert")
-app.add_typer(password_cmd.app, name="password", help="🔑 Generate secure passwords & passphrases")
-app.add_typer(cron_cmd.app, name="cron", help="⏰ Generate & explain cron expressions")
-app.add_typer(hash_cmd.app, name="hash", help="🔒 Generate hashes (MD5, SHA, BLAKE2, HMAC)")
-app.add_typer(base64_cmd.app, name="base64", help="📦 Base64 encode & decode")
-app.add_typer(jwt_cmd.app, name="jwt", help="🎫 Decode & inspect JWT tokens")
-app.add_typer(uuid_cmd.app, name="uuid", help="🆔 Generate UUIDs (v1, v4, v5)")
-app.add_typer(cert_cmd.app, name="cert", help="📜 Inspect SSL/TLS certificates")
-app.add_typer(network_cmd.app, name="net", help="🌐 Network utilities (DNS, ping, port check)")
-
 
 @app.command("version")
 def version():
     """Show Rex version."""
+    from rich import box
+    from rich.panel import Panel
+
     console.print(
         Panel(
             f"[bold green]🦖 Rex[/bold green] v{__version__}\n"
@@ -74,6 +88,7 @@ def info():
         ("net", "Network utilities", "DNS lookup, ping, port check, whois"),
     ]
 
+    from rich import box
     from rich.table import Table
 
     table = Table(
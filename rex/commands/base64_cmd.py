@@ -1,29 +1,55 @@
 """Base64 encode & decode operations."""
 
-import base64
+import mmap
 import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich import box
 
-console = Console()
+from rex._ui import console
+
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib module
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 app = typer.Typer(no_args_is_help=True)
 
+# Encode files in chunks that are a multiple of 3 bytes so padding only
+# ever appears at the end of the output
+ENCODE_CHUNK_SIZE = 3 << 20
+# Files at least this large are memory-mapped instead of read into a bytes object
+MMAP_THRESHOLD = 64 * 1024
+
+
+@contextmanager
+def _open_file(file: Path) -> Iterator[Union[bytes, mmap.mmap]]:
+    """Yield a file's contents, mapped into memory when it is large enough to be worth it."""
+    if not file.exists():
+        console.print(f"[red]✗ File not found: {file}[/red]")
+        raise typer.Exit(1)
+    if file.stat().st_size < MMAP_THRESHOLD:
+        yield file.read_bytes()
+        return
+    with file.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        yield mm
+
 
-def _read_input(data: Optional[str], file: Optional[Path]) -> bytes:
+@contextmanager
+def _open_input(data: Optional[str], file: Optional[Path]) -> Iterator[Union[bytes, mmap.mmap]]:
     if file:
-        if not file.exists():
-            console.print(f"[red]✗ File not found: {file}[/red]")
-            raise typer.Exit(1)
-        return file.read_bytes()
+        with _open_file(file) as content:
+            yield content
     elif data:
-        return data.encode()
+        yield data.encode()
     elif not sys.stdin.isatty():
-        return sys.stdin.buffer.read()
+        yield sys.stdin.buffer.read()
     else:
         console.print("[red]✗ No input provided.[/red]")
         raise typer.Exit(1)
@@ -35,20 +61,31 @@ def encode(
     file: Optional[Path] = typer.Option(None, "--file", "-f", help="Encode a file"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Write to file"),
     url_safe: bool = typer.Option(False, "--url-safe", "-u", help="Use URL-safe Base64"),
+    raw: bool = typer.Option(False, "--raw", help="Print only the encoded data, without formatting"),
 ):
     """Encode data to Base64."""
-    content = _read_input(data, file)
+    b64encode = base64.urlsafe_b64encode if url_safe else base64.b64encode
 
-    if url_safe:
-        result = base64.urlsafe_b64encode(content).decode()
-    else:
-        result = base64.b64encode(content).decode()
+    if file and output:
+        with _open_file(file) as content, memoryview(content) as view, output.open("wb") as dst:
+            for start in range(0, len(view), ENCODE_CHUNK_SIZE):
+                dst.write(b64encode(view[start:start + ENCODE_CHUNK_SIZE]))
+        console.print(f"[green]✓ Encoded data written to {output}[/green]")
+        return
+
+    with _open_input(data, file) as content:
+        encoded = b64encode(content)
 
     if output:
-        output.write_text(result)
+        output.write_bytes(encoded)
         console.print(f"[green]✓ Encoded data written to {output}[/green]")
+    elif raw:
+        typer.echo(encoded.decode())
     else:
-        console.print(Panel(result, title="📦 Base64 Encoded", border_style="green", box=box.ROUNDED))
+        from rich import box
+        from rich.panel import Panel
+
+        console.print(Panel(encoded.decode(), title="📦 Base64 Encoded", border_style="green", box=box.ROUNDED))
 
 
 @app.command("decode")
@@ -57,23 +94,29 @@ def decode(
     file: Optional[Path] = typer.Option(None, "--file", "-f", help="Read from file"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Write to file"),
     url_safe: bool = typer.Option(False, "--url-safe", "-u", help="URL-safe Base64"),
+    raw: bool = typer.Option(False, "--raw", help="Write the decoded bytes to stdout as-is"),
 ):
     """Decode Base64 data."""
-    content = _read_input(data, file)
-
-    try:
-        if url_safe:
-            result = base64.urlsafe_b64decode(content)
-        else:
-            result = base64.b64decode(content)
-    except Exception as e:
-        console.print(f"[red]✗ Invalid Base64: {e}[/red]")
-        raise typer.Exit(1)
+    with _open_input(data, file) as content:
+        try:
+            if url_safe:
+                result = base64.urlsafe_b64decode(content)
+            else:
+                result = base64.b64decode(content)
+        except Exception as e:
+            console.print(f"[red]✗ Invalid Base64: {e}[/red]")
+            raise typer.Exit(1)
 
     if output:
         output.write_bytes(result)
         console.print(f"[green]✓ Decoded data written to {output}[/green]")
+    elif raw:
+        sys.stdout.buffer.write(result)
+        sys.stdout.flush()
     else:
+        from rich import box
+        from rich.panel import Panel
+
         try:
             console.print(Panel(result.decode(), title="📦 Base64 Decoded", border_style="green", box=box.ROUNDED))
         except UnicodeDecodeError:
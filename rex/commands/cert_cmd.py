@@ -1,19 +1,78 @@
 """Inspect SSL/TLS certificates."""
 
+import asyncio
 import ssl
 import socket
+import sys
 from datetime import datetime, timezone
+from functools import cache
+from itertools import islice
+from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
-from rich import box
 
-console = Console()
+from rex._ui import console
+
 app = typer.Typer(no_args_is_help=True)
 
 
+# Month abbreviations as they appear in OpenSSL's notBefore/notAfter strings
+_MONTHS = {m: i for i, m in enumerate(
+    ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"], 1
+)}
+
+
+@cache
+def _context() -> ssl.SSLContext:
+    """Return the shared default SSL context (the trust store is loaded once per process)."""
+    return ssl.create_default_context()
+
+
+def _fetch_cert(host: str, port: int, timeout: float) -> dict:
+    """Complete a TLS handshake with host and return its verified peer certificate."""
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        with _context().wrap_socket(sock, server_hostname=host) as ssock:
+            return ssock.getpeercert()
+
+
+def _parse_cert_time(value: str) -> datetime:
+    """Parse a certificate time such as 'Jun  1 12:00:00 2026 GMT' without strptime."""
+    month, day, clock, year, _ = value.split()
+    hour, minute, second = clock.split(":")
+    return datetime(int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second), tzinfo=timezone.utc)
+
+
+async def _fetch_cert_async(host: str, port: int, timeout: float) -> dict:
+    """Like _fetch_cert, but on the event loop so many handshakes can be in flight at once."""
+    _, writer = await asyncio.wait_for(
+        asyncio.open_connection(host, port, ssl=_context(), server_hostname=host), timeout
+    )
+    try:
+        return writer.get_extra_info("peercert")
+    finally:
+        writer.close()
+        try:
+            # Let the TLS shutdown finish before the event loop is torn down
+            await asyncio.wait_for(writer.wait_closed(), timeout)
+        except (OSError, asyncio.TimeoutError):
+            pass
+
+
+def _days_left(cert: dict) -> int:
+    """Days until the certificate's notAfter date (negative once expired)."""
+    not_after = _parse_cert_time(cert["notAfter"])
+    return (not_after - datetime.now(tz=timezone.utc)).days
+
+
+def _split_host(entry: str, default_port: int) -> tuple[str, int]:
+    """Split an optional ':port' suffix off a host entry."""
+    host, sep, port = entry.rpartition(":")
+    if sep and host and ":" not in host and port.isdigit():
+        return host, int(port)
+    return entry, default_port
+
+
 @app.command("inspect")
 def inspect(
     host: str = typer.Argument(..., help="Hostname to check (e.g., google.com)"),
@@ -22,9 +81,8 @@ def inspect(
 ):
     """Inspect SSL/TLS certificate of a remote host."""
     try:
-        context = ssl.create_default_context()
         with socket.create_connection((host, port), timeout=timeout) as sock:
-            with context.wrap_socket(sock, server_hostname=host) as ssock:
+            with _context().wrap_socket(sock, server_hostname=host) as ssock:
                 cert = ssock.getpeercert()
                 cipher = ssock.cipher()
                 protocol = ssock.version()
@@ -36,20 +94,23 @@ def inspect(
         raise typer.Exit(1)
 
     # Parse dates
-    not_before = datetime.strptime(cert["notBefore"], "%b %d %H:%M:%S %Y %Z").replace(tzinfo=timezone.utc)
-    not_after = datetime.strptime(cert["notAfter"], "%b %d %H:%M:%S %Y %Z").replace(tzinfo=timezone.utc)
+    not_before = _parse_cert_time(cert["notBefore"])
+    not_after = _parse_cert_time(cert["notAfter"])
     now = datetime.now(tz=timezone.utc)
     days_left = (not_after - now).days
     is_expired = days_left < 0
 
     # Subject & Issuer
-    subject = dict(x[0] for x in cert.get("subject", ()))
-    issuer = dict(x[0] for x in cert.get("issuer", ()))
+    subject = {k: v for rdn in cert.get("subject", ()) for k, v in rdn}
+    issuer = {k: v for rdn in cert.get("issuer", ()) for k, v in rdn}
 
     # SAN
-    san_list = [entry[1] for entry in cert.get("subjectAltName", ())]
+    sans = cert.get("subjectAltName", ())
 
     # Display
+    from rich import box
+    from rich.table import Table
+
     table = Table(title=f"📜 Certificate — {host}:{port}", box=box.ROUNDED, border_style="green")
     table.add_column("Field", style="bold cyan", min_width=18)
     table.add_column("Value", style="white")
@@ -73,10 +134,10 @@ def inspect(
     if cipher:
         table.add_row("Cipher", f"{cipher[0]} ({cipher[2]} bit)")
 
-    if san_list:
-        table.add_row("SANs", ", ".join(san_list[:5]))
-        if len(san_list) > 5:
-            table.add_row("", f"[dim]... and {len(san_list) - 5} more[/dim]")
+    if sans:
+        table.add_row("SANs", ", ".join(value for _, value in islice(sans, 5)))
+        if len(sans) > 5:
+            table.add_row("", f"[dim]... and {len(sans) - 5} more[/dim]")
 
     console.print(table)
 
@@ -86,20 +147,20 @@ def expiry(
     host: str = typer.Argument(..., help="Hostname to check"),
     port: int = typer.Option(443, "--port", "-p"),
     warn_days: int = typer.Option(30, "--warn", "-w", help="Warning threshold in days"),
+    raw: bool = typer.Option(False, "--raw", help="Print only the days left (exit code unchanged)"),
 ):
     """Quick check certificate expiry (useful for monitoring scripts)."""
     try:
-        context = ssl.create_default_context()
-        with socket.create_connection((host, port), timeout=10) as sock:
-            with context.wrap_socket(sock, server_hostname=host) as ssock:
-                cert = ssock.getpeercert()
+        cert = _fetch_cert(host, port, 10)
     except Exception as e:
         console.print(f"[red]CRITICAL — {host}: {e}[/red]")
         raise typer.Exit(2)
 
-    not_after = datetime.strptime(cert["notAfter"], "%b %d %H:%M:%S %Y %Z").replace(tzinfo=timezone.utc)
-    days_left = (not_after - datetime.now(tz=timezone.utc)).days
+    days_left = _days_left(cert)
 
+    if raw:
+        typer.echo(days_left)
+        raise typer.Exit(2 if days_left < 0 else 1 if days_left <= warn_days else 0)
     if days_left < 0:
         console.print(f"[red]CRITICAL — {host}: Certificate expired {abs(days_left)} days ago[/red]")
         raise typer.Exit(2)
@@ -108,3 +169,65 @@ def expiry(
         raise typer.Exit(1)
     else:
         console.print(f"[green]OK — {host}: Certificate valid for {days_left} days[/green]")
+
+
+@app.command("expiry-bulk")
+def expiry_bulk(
+    hosts: Optional[list[str]] = typer.Argument(None, help="Hosts to check (host or host:port)"),
+    file: Optional[Path] = typer.Option(None, "--file", "-f", help="Read hosts from file (one per line)"),
+    port: int = typer.Option(443, "--port", "-p", help="Default port"),
+    warn_days: int = typer.Option(30, "--warn", "-w", help="Warning threshold in days"),
+    timeout: int = typer.Option(10, "--timeout", "-t", help="Connection timeout in seconds"),
+    concurrency: int = typer.Option(200, "--concurrency", "-c", help="Hosts checked in parallel"),
+):
+    """Check certificate expiry for many hosts at once (exit code is the worst result)."""
+    entries = list(hosts or [])
+    if file:
+        if not file.exists():
+            console.print(f"[red]✗ File not found: {file}[/red]")
+            raise typer.Exit(1)
+        entries += file.read_text().split()
+    elif not entries and not sys.stdin.isatty():
+        entries = sys.stdin.read().split()
+
+    if not entries:
+        console.print("[red]✗ No hosts provided.[/red]")
+        raise typer.Exit(1)
+
+    targets = [_split_host(entry, port) for entry in entries]
+
+    async def check(target: tuple[str, int], limit: asyncio.Semaphore) -> tuple[int, str]:
+        async with limit:
+            try:
+                days_left = _days_left(await _fetch_cert_async(*target, timeout))
+            except asyncio.TimeoutError:
+                return 2, "[red]CRITICAL[/red] — timed out"
+            except Exception as e:
+                return 2, f"[red]CRITICAL[/red] — {e}"
+        if days_left < 0:
+            return 2, f"[red]CRITICAL[/red] — expired {abs(days_left)} days ago"
+        elif days_left <= warn_days:
+            return 1, f"[yellow]WARNING[/yellow] — expires in {days_left} days"
+        return 0, f"[green]OK[/green] — valid for {days_left} days"
+
+    async def check_all() -> list[tuple[int, str]]:
+        # One event loop multiplexes every handshake; the semaphore caps open connections
+        limit = asyncio.Semaphore(max(1, concurrency))
+        return await asyncio.gather(*(check(target, limit) for target in targets))
+
+    results = asyncio.run(check_all())
+
+    from rich import box
+    from rich.table import Table
+
+    table = Table(title=f"📜 Certificate Expiry — {len(targets)} host(s)", box=box.ROUNDED, border_style="green")
+    table.add_column("Host", style="bold cyan")
+    table.add_column("Status", style="white")
+
+    for (host, host_port), (_, status) in zip(targets, results):
+        table.add_row(f"{host}:{host_port}", status)
+
+    console.print(table)
+    worst = max(code for code, _ in results)
+    if worst:
+        raise typer.Exit(worst)
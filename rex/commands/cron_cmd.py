@@ -1,18 +1,45 @@
 """Generate & explain cron expressions."""
 
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich import box
 
-console = Console()
+from rex._ui import console
+
 app = typer.Typer(no_args_is_help=True)
 
 FIELD_NAMES = ["Minute", "Hour", "Day (Month)", "Month", "Day (Week)"]
 FIELD_RANGES = ["0-59", "0-23", "1-31", "1-12", "0-7 (0,7=Sun)"]
+# Lowercased field names as used in explanations
+FIELD_UNITS = [name.lower() for name in FIELD_NAMES]
+
+SPECIAL_EXPRESSIONS = {
+    "@reboot": "Run once at system startup",
+    "@yearly": "Run once a year (0 0 1 1 *)",
+    "@annually": "Run once a year (0 0 1 1 *)",
+    "@monthly": "Run once a month (0 0 1 * *)",
+    "@weekly": "Run once a week (0 0 * * 0)",
+    "@daily": "Run once a day (0 0 * * *)",
+    "@midnight": "Run once a day (0 0 * * *)",
+    "@hourly": "Run once an hour (0 * * * *)",
+}
+
+# One pattern classifies a field; the last matched group selects the
+# explanation: 1 = "*", 2 = "*/N", 3 = list, 5 = range
+_FIELD_RE = re.compile(r"(\*)|\*/(.*)|(.*,.*)|([^-]*)-([^-]*)(?:-.*)?")
+
+# A crontab line that sets an environment variable (NAME=value)
+_ENV_LINE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\s*=")
+
+DAY_NAMES = {"0": "Sunday", "1": "Monday", "2": "Tuesday", "3": "Wednesday",
+             "4": "Thursday", "5": "Friday", "6": "Saturday", "7": "Sunday"}
 
 PRESETS = {
     "every-minute": ("* * * * *", "Every minute"),
@@ -48,17 +75,7 @@ def explain(
 ):
     """Explain a cron expression in human-readable format."""
     if expression.startswith("@"):
-        special = {
-            "@reboot": "Run once at system startup",
-            "@yearly": "Run once a year (0 0 1 1 *)",
-            "@annually": "Run once a year (0 0 1 1 *)",
-            "@monthly": "Run once a month (0 0 1 * *)",
-            "@weekly": "Run once a week (0 0 * * 0)",
-            "@daily": "Run once a day (0 0 * * *)",
-            "@midnight": "Run once a day (0 0 * * *)",
-            "@hourly": "Run once an hour (0 * * * *)",
-        }
-        desc = special.get(expression, "Unknown special expression")
+        desc = SPECIAL_EXPRESSIONS.get(expression, "Unknown special expression")
         console.print(Panel(f"[bold]{expression}[/bold]\n\n{desc}", title="⏰ Cron Expression", border_style="green", box=box.ROUNDED))
         return
 
@@ -73,8 +90,8 @@ def explain(
     table.add_column("Range", style="dim")
     table.add_column("Meaning", style="green")
 
-    for field_name, field_range, value in zip(FIELD_NAMES, FIELD_RANGES, parts):
-        meaning = _explain_field(value, field_name)
+    for field_name, field_range, unit, value in zip(FIELD_NAMES, FIELD_RANGES, FIELD_UNITS, parts):
+        meaning = _explain_field(value, unit)
         table.add_row(field_name, value, field_range, meaning)
 
     console.print(table)
@@ -84,19 +101,18 @@ def explain(
     console.print(f"\n[bold green]📖 Summary:[/bold green] {summary}")
 
 
-def _explain_field(value: str, field_name: str) -> str:
-    """Explain a single cron field."""
-    if value == "*":
-        return f"Every {field_name.lower()}"
-    elif value.startswith("*/"):
-        return f"Every {value[2:]} {field_name.lower()}(s)"
-    elif "," in value:
-        return f"At {field_name.lower()} {value}"
-    elif "-" in value:
-        parts = value.split("-")
-        return f"From {parts[0]} to {parts[1]}"
+def _explain_field(value: str, unit: str) -> str:
+    """Explain a single cron field (unit is the lowercased field name)."""
+    m = _FIELD_RE.fullmatch(value)
+    kind = m.lastindex if m else 0
+    if kind == 1:
+        return f"Every {unit}"
+    elif kind == 2:
+        return f"Every {m[2]} {unit}(s)"
+    elif kind == 5:
+        return f"From {m[4]} to {m[5]}"
     else:
-        return f"At {field_name.lower()} {value}"
+        return f"At {unit} {value}"
 
 
 def _build_summary(parts: list) -> str:
@@ -120,23 +136,68 @@ def _build_summary(parts: list) -> str:
     if month != "*":
         pieces.append(f"in month(s) {month}")
     if dow != "*":
-        day_map = {"0": "Sunday", "1": "Monday", "2": "Tuesday", "3": "Wednesday",
-                   "4": "Thursday", "5": "Friday", "6": "Saturday", "7": "Sunday"}
-        if "-" in dow:
-            start, end = dow.split("-")
-            pieces.append(f"on {day_map.get(start, start)} through {day_map.get(end, end)}")
-        elif "," in dow:
-            days = [day_map.get(d, d) for d in dow.split(",")]
-            pieces.append(f"on {', '.join(days)}")
-        else:
-            pieces.append(f"on {day_map.get(dow, dow)}")
+        pieces.append(f"on {', '.join(_day_name(d) for d in dow.split(','))}")
 
     return " ".join(pieces)
 
 
-@app.command("presets")
-def presets():
-    """Show common cron expression presets."""
+def _day_name(day: str) -> str:
+    """Name one day-of-week list item: a day number, an a-b range, or anything else as written."""
+    if day.count("-") == 1:
+        start, end = day.split("-")
+        return f"{DAY_NAMES.get(start, start)} through {DAY_NAMES.get(end, end)}"
+    return DAY_NAMES.get(day, day)
+
+
+@app.command("explain-batch")
+def explain_batch(
+    file: Optional[Path] = typer.Option(None, "--file", "-f", help="Read expressions from file (default: stdin)"),
+):
+    """Summarize many cron expressions or crontab lines, one per line."""
+    if file:
+        if not file.exists():
+            console.print(f"[red]✗ File not found: {file}[/red]")
+            raise typer.Exit(1)
+        lines = file.read_text().splitlines()
+    elif not sys.stdin.isatty():
+        lines = sys.stdin.read().splitlines()
+    else:
+        console.print("[red]✗ No input provided.[/red]")
+        raise typer.Exit(1)
+
+    table = Table(title="⏰ Cron Expressions", box=box.ROUNDED, border_style="green")
+    table.add_column("Expression", style="bold cyan")
+    table.add_column("Summary", style="green")
+
+    invalid = 0
+    for line in lines:
+        line = line.strip()
+        # Crontab environment settings (SHELL=/bin/bash, MAILTO=...) are not schedules
+        if not line or line.startswith("#") or _ENV_LINE.match(line):
+            continue
+        # Anything after the schedule (e.g. a crontab command) is ignored
+        parts = line.split(None, 5)
+        if parts[0].startswith("@"):
+            table.add_row(parts[0], SPECIAL_EXPRESSIONS.get(parts[0], "Unknown special expression"))
+        elif len(parts) >= 5:
+            try:
+                table.add_row(" ".join(parts[:5]), _build_summary(parts[:5]))
+            except Exception as e:
+                # One bad line is reported in its row rather than ending the batch
+                table.add_row(" ".join(parts[:5]), f"[red]✗ {e}[/red]")
+                invalid += 1
+        else:
+            table.add_row(line, f"[red]✗ Expected 5 fields, got {len(parts)}[/red]")
+            invalid += 1
+
+    console.print(table)
+    if invalid:
+        raise typer.Exit(1)
+
+
+@lru_cache(maxsize=1)
+def _presets_table() -> Table:
+    """Build the presets table once; PRESETS never changes at runtime."""
     table = Table(title="⏰ Cron Presets", box=box.ROUNDED, border_style="green")
     table.add_column("Name", style="bold cyan", min_width=18)
     table.add_column("Expression", style="white", min_width=22)
@@ -144,8 +205,13 @@ def presets():
 
     for name, (expr, desc) in PRESETS.items():
         table.add_row(name, expr, desc)
+    return table
 
-    console.print(table)
+
+@app.command("presets")
+def presets():
+    """Show common cron expression presets."""
+    console.print(_presets_table())
     console.print("\n[dim]Use: [bold]rex cron generate <preset-name>[/bold] to copy a preset.[/dim]")
 
 
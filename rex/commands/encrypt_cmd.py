@@ -1,14 +1,18 @@
 """Encrypt & decrypt data with multiple algorithms."""
 
 import os
-import base64
+import hashlib
+import io
 import json
+import mmap
+import struct
 import sys
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 from rich import box
 
@@ -16,31 +20,384 @@ from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+
+from rex._ui import console
+
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib module
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    # libsodium's vectorized ChaCha20-Poly1305 (same IETF construction and output as OpenSSL's)
+    from nacl import bindings as sodium
+except ImportError:
+    sodium = None
 
-console = Console()
 app = typer.Typer(no_args_is_help=True)
 
 ALGORITHMS = ["aes-256-gcm", "chacha20-poly1305", "fernet"]
+# AEAD algorithms that can encrypt files as a stream of frames
+STREAM_ALGORITHMS = ["aes-256-gcm", "chacha20-poly1305"]
+
+# Plaintext bytes per frame when streaming a file to --output
+STREAM_CHUNK = 1 << 20
+# Frame prefix: ciphertext length, then nonce (4-byte counter + 8 random bytes)
+_FRAME = struct.Struct(">I12s")
+
+# Files at least this large are encrypted straight from a read-only memory map
+MMAP_THRESHOLD = 64 * 1024
+
+# KDF used for new ciphertexts; its parameters are stored in the payload
+DEFAULT_KDF = {"name": "scrypt", "n": 2**15, "r": 8, "p": 1}
+# JSON payloads without a "kdf" entry were produced with PBKDF2
+LEGACY_KDF = {"name": "pbkdf2-sha256", "iterations": 480000}
+
+# Binary payload: magic, format version, algorithm id, KDF id; followed by the
+# KDF parameters, length-prefixed salt and nonce, then the ciphertext
+_PAYLOAD = struct.Struct(">4sBBB")
+PAYLOAD_MAGIC = b"REXE"
+PAYLOAD_VERSION = 1
+ALGORITHM_IDS = {"aes-256-gcm": 1, "chacha20-poly1305": 2, "fernet": 3}
+# KDF name -> (id, parameter layout, parameter names)
+KDF_FORMATS = {
+    "scrypt": (1, struct.Struct(">III"), ("n", "r", "p")),
+    "pbkdf2-sha256": (2, struct.Struct(">I"), ("iterations",)),
+}
+# Upper bounds on KDF parameters read from a payload, so a crafted ciphertext
+# cannot make decryption allocate or compute without limit
+SCRYPT_MAX_MEMORY = 1 << 30  # 128 * n * r bytes
+SCRYPT_MAX_P = 16
+PBKDF2_MAX_ITERATIONS = 10_000_000
+# Largest frame size accepted from a stream header, and the AEAD tag added per frame
+STREAM_MAX_CHUNK = 64 << 20
+_TAG_SIZE = 16
+# Longest stream header line read before the frames
+_HEADER_LIMIT = 64 * 1024
+_ALGORITHM_NAMES = {i: name for name, i in ALGORITHM_IDS.items()}
+_KDF_BY_ID = {fmt[0]: (name, *fmt[1:]) for name, fmt in KDF_FORMATS.items()}
+
+# Derived keys for this process, keyed on (sha256(password), salt, kdf)
+_KEY_CACHE: dict[tuple[bytes, bytes, str], bytes] = {}
+
+
+def _derive_key(password: str, salt: bytes, kdf: dict, key_length: int = 32) -> bytes:
+    """Derive a key from password using the given KDF parameters."""
+    if kdf["name"] == "scrypt":
+        return Scrypt(salt=salt, length=key_length, n=kdf["n"], r=kdf["r"], p=kdf["p"]).derive(password.encode())
+    if kdf["name"] == "pbkdf2-sha256":
+        pbkdf2 = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=key_length,
+            salt=salt,
+            iterations=kdf["iterations"],
+        )
+        return pbkdf2.derive(password.encode())
+    raise ValueError(f"Unsupported KDF: {kdf['name']}")
+
+
+def _check_kdf(kdf) -> dict:
+    """Validate KDF parameters taken from a payload, raising ValueError if they are unusable."""
+    if not isinstance(kdf, dict) or kdf.get("name") not in KDF_FORMATS:
+        raise ValueError("Unsupported KDF")
+    _, _, fields = KDF_FORMATS[kdf["name"]]
+    if any(type(kdf.get(f)) is not int or kdf[f] < 1 for f in fields):
+        raise ValueError("Invalid KDF parameters")
+    if kdf["name"] == "scrypt":
+        n, r, p = kdf["n"], kdf["r"], kdf["p"]
+        if n < 2 or n & (n - 1) or 128 * n * r > SCRYPT_MAX_MEMORY or p > SCRYPT_MAX_P:
+            raise ValueError("Invalid scrypt parameters")
+    elif kdf["iterations"] > PBKDF2_MAX_ITERATIONS:
+        raise ValueError("Too many PBKDF2 iterations")
+    return kdf
+
+
+def _derive_key_cached(password: str, salt: bytes, kdf: dict) -> bytes:
+    """Derive a key once per (password, salt, kdf) within a single process."""
+    cache_key = (hashlib.sha256(password.encode()).digest(), salt, json.dumps(kdf, sort_keys=True))
+    if cache_key not in _KEY_CACHE:
+        _KEY_CACHE[cache_key] = _derive_key(password, salt, kdf)
+    return _KEY_CACHE[cache_key]
+
+
+def _load_key_file(path: Path) -> dict:
+    """Load key material written by `rex encrypt derive-key`."""
+    try:
+        material = json.loads(path.read_text())
+        return {
+            "kdf": _check_kdf(material["kdf"]),
+            "salt": base64.b64decode(material["salt"]),
+            "key": base64.b64decode(material["key"]),
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        console.print(f"[red]✗ Invalid key file: {path}[/red]")
+        raise typer.Exit(1)
+
+
+def _key_for(password: Optional[str], key_material: Optional[dict], salt: bytes, kdf: dict) -> bytes:
+    """Return the key for a payload, preferring pre-derived key material over the password.
+
+    Raises ValueError when the key material was derived with another salt or KDF.
+    """
+    if key_material is None:
+        return _derive_key_cached(password, salt, kdf)
+    if key_material["salt"] != salt or key_material["kdf"] != kdf:
+        raise ValueError("Key file does not match this ciphertext (different salt or KDF).")
+    return key_material["key"]
+
+
+def _resolve_key(password: Optional[str], key_material: Optional[dict], salt: bytes, kdf: dict) -> bytes:
+    """Like _key_for, but print the error and exit when the key material does not fit."""
+    try:
+        return _key_for(password, key_material, salt, kdf)
+    except ValueError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        raise typer.Exit(1)
+
+
+def _pack_header(algo: str, kdf: dict, salt: bytes, nonce: bytes) -> bytes:
+    """Serialize everything in a binary payload that precedes the ciphertext."""
+    kdf_id, params, fields = KDF_FORMATS[kdf["name"]]
+    return b"".join((
+        _PAYLOAD.pack(PAYLOAD_MAGIC, PAYLOAD_VERSION, ALGORITHM_IDS[algo], kdf_id),
+        params.pack(*(kdf[f] for f in fields)),
+        bytes([len(salt)]), salt,
+        bytes([len(nonce)]), nonce,
+    ))
+
+
+def _unpack_binary(blob: bytes) -> dict:
+    """Parse a binary payload; the ciphertext is returned as a view into blob."""
+    _, version, alg_id, kdf_id = _PAYLOAD.unpack_from(blob)
+    if version != PAYLOAD_VERSION:
+        raise ValueError(f"Unsupported payload version: {version}")
+    name, params, fields = _KDF_BY_ID[kdf_id]
+    offset = _PAYLOAD.size
+    kdf = {"name": name, **dict(zip(fields, params.unpack_from(blob, offset)))}
+    offset += params.size
+    salt_end = offset + 1 + blob[offset]
+    salt = blob[offset + 1:salt_end]
+    nonce_end = salt_end + 1 + blob[salt_end]
+    nonce = blob[salt_end + 1:nonce_end]
+    data = memoryview(blob)[nonce_end:]
+    return {"alg": _ALGORITHM_NAMES.get(alg_id), "kdf": kdf, "salt": salt, "nonce": nonce, "data": data}
+
+
+def _unpack_json(blob: bytes) -> dict:
+    """Parse a JSON payload from releases before the binary format."""
+    payload = json.loads(blob)
+    payload["kdf"] = payload.get("kdf", LEGACY_KDF)
+    payload["salt"] = base64.b64decode(payload["salt"])
+    if payload.get("alg") == "fernet":
+        payload["data"] = payload["data"].encode()
+    else:
+        payload["nonce"] = base64.b64decode(payload["nonce"])
+        payload["data"] = base64.b64decode(payload["data"])
+    return payload
+
+
+def _parse_payload(raw: bytes) -> dict:
+    """Decode an encrypted payload (raw binary, raw JSON or Base64 text) and check its algorithm.
 
+    Raises ValueError with a message for the user when the payload cannot be used.
+    """
+    try:
+        blob = raw if raw.startswith((PAYLOAD_MAGIC, b"{")) else base64.b64decode(raw.strip())
+        payload = _unpack_binary(blob) if blob.startswith(PAYLOAD_MAGIC) else _unpack_json(blob)
+        _check_kdf(payload["kdf"])
+    except Exception:
+        raise ValueError("Invalid encrypted data format.") from None
+
+    if payload.get("alg") not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {payload.get('alg', '')}")
+    return payload
+
+
+def _unpack(raw: bytes) -> dict:
+    """Like _parse_payload, but print the error and exit when the payload cannot be used."""
+    try:
+        return _parse_payload(raw)
+    except ValueError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        raise typer.Exit(1)
+
+
+def _is_stream_header(line: bytes) -> bool:
+    """Tell a streamed ciphertext's header line from a whole JSON payload, which carries "data"."""
+    try:
+        return "data" not in json.loads(line)
+    except ValueError:
+        return False
+
+
+def _unpack_stream_header(line: bytes) -> dict:
+    """Parse the JSON header line that starts a streamed ciphertext."""
+    try:
+        header = json.loads(line)
+        header["salt"] = base64.b64decode(header["salt"])
+        _check_kdf(header.get("kdf"))
+        chunk = header.get("chunk", STREAM_CHUNK)
+        if type(chunk) is not int or not 0 < chunk <= STREAM_MAX_CHUNK:
+            raise ValueError("Invalid chunk size")
+    except Exception:
+        console.print("[red]✗ Invalid encrypted data format.[/red]")
+        raise typer.Exit(1)
+
+    if header.get("alg") not in STREAM_ALGORITHMS:
+        console.print(f"[red]✗ Unknown algorithm: {header.get('alg', '')}[/red]")
+        raise typer.Exit(1)
+    return header
+
+
+@contextmanager
+def _map_file(file: Path) -> Iterator[Union[bytes, mmap.mmap]]:
+    """Yield the plaintext of an existing file, memory-mapped unless it is small."""
+    if file.stat().st_size < MMAP_THRESHOLD:
+        yield file.read_bytes()
+        return
+    with file.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield mm
+
+
+class _SodiumChaCha20Poly1305:
+    """ChaCha20Poly1305 with the cryptography API, computed by libsodium."""
 
-def _derive_key(password: str, salt: bytes, key_length: int = 32) -> bytes:
-    """Derive a key from password using PBKDF2."""
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=key_length,
-        salt=salt,
-        iterations=480000,
-    )
-    return kdf.derive(password.encode())
+    def __init__(self, key: bytes):
+        self._key = key
+
+    def encrypt(self, nonce: bytes, data: bytes, associated_data: Optional[bytes]) -> bytes:
+        return sodium.crypto_aead_chacha20poly1305_ietf_encrypt(bytes(data), associated_data, nonce, self._key)
+
+    def decrypt(self, nonce: bytes, data: bytes, associated_data: Optional[bytes]) -> bytes:
+        return sodium.crypto_aead_chacha20poly1305_ietf_decrypt(bytes(data), associated_data, nonce, self._key)
+
+
+def _aead(algo: str, key: bytes):
+    """Build the AEAD cipher for a streamable algorithm."""
+    if algo == "aes-256-gcm":
+        return AESGCM(key)
+    return _SodiumChaCha20Poly1305(key) if sodium else ChaCha20Poly1305(key)
+
+
+def _encrypt_stream(src: BinaryIO, dst: BinaryIO, header: dict, cipher) -> None:
+    """Write the header line, then one authenticated frame per chunk of src.
+
+    Each nonce starts with the frame counter so frames cannot be reordered, and
+    the final frame is encrypted with a distinct AAD so truncation is detected.
+    """
+    dst.write(json.dumps(header).encode() + b"\n")
+    counter = 0
+    chunk = src.read(STREAM_CHUNK)
+    while True:
+        following = src.read(STREAM_CHUNK)
+        nonce = struct.pack(">I", counter) + os.urandom(8)
+        ciphertext = cipher.encrypt(nonce, chunk, b"\x00" if following else b"\x01")
+        dst.write(_FRAME.pack(len(ciphertext), nonce))
+        dst.write(ciphertext)
+        if not following:
+            return
+        chunk, counter = following, counter + 1
+
+
+def _decrypt_stream(src: BinaryIO, dst: BinaryIO, cipher, chunk: int = STREAM_CHUNK) -> None:
+    """Decrypt the frames following a stream header, failing on reordering or truncation.
+
+    No frame may be longer than the header's chunk size plus the AEAD tag, so a
+    corrupt length is rejected before anything is read for it.
+    """
+    counter = 0
+    head = src.read(_FRAME.size)
+    while True:
+        if len(head) != _FRAME.size:
+            raise ValueError("Truncated frame header")
+        length, nonce = _FRAME.unpack(head)
+        if length > chunk + _TAG_SIZE:
+            raise ValueError("Frame too long")
+        if nonce[:4] != struct.pack(">I", counter):
+            raise ValueError("Frame out of order")
+        ciphertext = src.read(length)
+        if len(ciphertext) != length:
+            raise ValueError("Truncated frame")
+        head = src.read(_FRAME.size)
+        dst.write(cipher.decrypt(nonce, ciphertext, b"\x00" if head else b"\x01"))
+        if not head:
+            return
+        counter += 1
+
+
+def _decrypt_payload(payload: dict, key: bytes) -> bytes:
+    """Decrypt an unpacked payload with an already-derived key."""
+    algo = payload["alg"]
+    if algo in STREAM_ALGORITHMS:
+        return _aead(algo, key).decrypt(payload["nonce"], payload["data"], None)
+    else:
+        fernet_key = base64.urlsafe_b64encode(key)
+        return Fernet(fernet_key).decrypt(bytes(payload["data"]))
+
+
+def _decrypt_stream_file(
+    header_line: bytes, src: BinaryIO, output: Optional[Path], password: Optional[str], key_material: Optional[dict]
+) -> None:
+    """Decrypt the frames of a streamed ciphertext into --output, or into memory for display."""
+    header = _unpack_stream_header(header_line)
+    key = _resolve_key(password, key_material, header["salt"], header["kdf"])
+    cipher = _aead(header["alg"], key)
+
+    try:
+        if output:
+            with output.open("wb") as dst:
+                _decrypt_stream(src, dst, cipher, header.get("chunk", STREAM_CHUNK))
+        else:
+            buffer = io.BytesIO()
+            _decrypt_stream(src, buffer, cipher, header.get("chunk", STREAM_CHUNK))
+    except Exception:
+        if output:
+            output.unlink(missing_ok=True)
+        console.print("[red]✗ Decryption failed. Wrong password or corrupted data.[/red]")
+        raise typer.Exit(1)
+
+    if output:
+        console.print(f"[green]✓ Decrypted data written to {output}[/green]")
+    else:
+        _show_plaintext(buffer.getvalue())
+
+
+def _read_or_stream(
+    src: BinaryIO, output: Optional[Path], password: Optional[str], key_material: Optional[dict]
+) -> Optional[bytes]:
+    """Read a whole payload from src, or decrypt a streamed ciphertext as it is read and return None."""
+    raw = b""
+    if src.peek(1)[:1] == b"{":
+        # The header line of a streamed ciphertext, or a JSON payload from older releases
+        raw = src.readline(_HEADER_LIMIT)
+        if _is_stream_header(raw):
+            _decrypt_stream_file(raw, src, output, password, key_material)
+            return None
+    return raw + src.read()
+
+
+def _show_plaintext(plaintext: bytes) -> None:
+    """Print decrypted text, or a size summary for binary data."""
+    try:
+        console.print(Panel(plaintext.decode(), title="🔓 Decrypted", border_style="green", box=box.ROUNDED))
+    except UnicodeDecodeError:
+        console.print(f"[green]✓ Decrypted {len(plaintext)} bytes (binary data — use --output to save)[/green]")
 
 
 @app.command("enc")
 def encrypt(
     data: Optional[str] = typer.Argument(None, help="Data to encrypt (or pipe via stdin)"),
-    password: str = typer.Option(..., "--password", "-p", prompt=True, hide_input=True, help="Encryption password"),
+    password: Optional[str] = typer.Option(
+        None, "--password", "-p", hide_input=True, help="Encryption password (prompted)"
+    ),
     algorithm: str = typer.Option("aes-256-gcm", "--algo", "-a", help="Algorithm: aes-256-gcm, chacha20-poly1305, fernet"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Write result to file"),
     file: Optional[Path] = typer.Option(None, "--file", "-f", help="Encrypt a file"),
+    key_file: Optional[Path] = typer.Option(
+        None, "--key-file", "-k", envvar="REX_KEY_FILE", help="Key file from 'rex encrypt derive-key'"
+    ),
 ):
     """Encrypt data or files."""
     algo = algorithm.lower()
@@ -48,12 +405,15 @@ def encrypt(
         console.print(f"[red]✗ Unknown algorithm: {algorithm}. Use: {', '.join(ALGORITHMS)}[/red]")
         raise typer.Exit(1)
 
-    # Get input data
+    key_material = _load_key_file(key_file) if key_file else None
+    if key_material is None and password is None:
+        password = typer.prompt("Password", hide_input=True)
+
+    # Get input data (files are read after key derivation, possibly as a stream)
     if file:
         if not file.exists():
             console.print(f"[red]✗ File not found: {file}[/red]")
             raise typer.Exit(1)
-        plaintext = file.read_bytes()
     elif data:
         plaintext = data.encode()
     elif not sys.stdin.isatty():
@@ -62,102 +422,191 @@ def encrypt(
         console.print("[red]✗ No data provided. Pass data as argument, --file, or pipe via stdin.[/red]")
         raise typer.Exit(1)
 
-    salt = os.urandom(16)
-    key = _derive_key(password, salt)
+    if key_material:
+        salt, kdf, key = key_material["salt"], key_material["kdf"], key_material["key"]
+    else:
+        salt, kdf = os.urandom(16), DEFAULT_KDF
+        key = _derive_key(password, salt, kdf)
 
-    if algo == "aes-256-gcm":
-        nonce = os.urandom(12)
-        aesgcm = AESGCM(key)
-        ciphertext = aesgcm.encrypt(nonce, plaintext, None)
-        payload = {"alg": algo, "salt": base64.b64encode(salt).decode(), "nonce": base64.b64encode(nonce).decode(), "data": base64.b64encode(ciphertext).decode()}
+    if file and output and algo in STREAM_ALGORITHMS:
+        header = {"alg": algo, "kdf": kdf, "salt": base64.b64encode(salt).decode(), "chunk": STREAM_CHUNK}
+        with file.open("rb") as src, output.open("wb") as dst:
+            _encrypt_stream(src, dst, header, _aead(algo, key))
+        console.print(f"[green]✓ Encrypted data written to {output}[/green]")
+        return
+    with _map_file(file) if file else nullcontext(plaintext) as plaintext:
+        if algo == "aes-256-gcm":
+            nonce = os.urandom(12)
+            aesgcm = AESGCM(key)
+            ciphertext = aesgcm.encrypt(nonce, plaintext, None)
 
-    elif algo == "chacha20-poly1305":
-        nonce = os.urandom(12)
-        chacha = ChaCha20Poly1305(key)
-        ciphertext = chacha.encrypt(nonce, plaintext, None)
-        payload = {"alg": algo, "salt": base64.b64encode(salt).decode(), "nonce": base64.b64encode(nonce).decode(), "data": base64.b64encode(ciphertext).decode()}
+        elif algo == "chacha20-poly1305":
+            nonce = os.urandom(12)
+            chacha = _aead(algo, key)
+            ciphertext = chacha.encrypt(nonce, plaintext, None)
 
-    elif algo == "fernet":
-        fernet_key = base64.urlsafe_b64encode(_derive_key(password, salt))
-        f = Fernet(fernet_key)
-        ciphertext = f.encrypt(plaintext)
-        payload = {"alg": algo, "salt": base64.b64encode(salt).decode(), "data": ciphertext.decode()}
+        elif algo == "fernet":
+            nonce = b""
+            fernet_key = base64.urlsafe_b64encode(key)
+            f = Fernet(fernet_key)
+            # Fernet only accepts bytes objects
+            ciphertext = f.encrypt(bytes(plaintext))
 
-    result = base64.b64encode(json.dumps(payload).encode()).decode()
+    header = _pack_header(algo, kdf, salt, nonce)
 
     if output:
-        output.write_text(result)
+        # Written in two parts so the ciphertext is never copied into a joined blob
+        with output.open("wb") as fh:
+            fh.write(header)
+            fh.write(ciphertext)
         console.print(f"[green]✓ Encrypted data written to {output}[/green]")
     else:
+        result = base64.b64encode(header + ciphertext).decode()
         console.print(Panel(result, title=f"🔐 Encrypted ({algo})", border_style="green", box=box.ROUNDED))
 
 
 @app.command("dec")
 def decrypt(
     data: Optional[str] = typer.Argument(None, help="Encrypted data (or pipe via stdin)"),
-    password: str = typer.Option(..., "--password", "-p", prompt=True, hide_input=True, help="Decryption password"),
+    password: Optional[str] = typer.Option(
+        None, "--password", "-p", hide_input=True, help="Decryption password (prompted)"
+    ),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Write result to file"),
     file: Optional[Path] = typer.Option(None, "--file", "-f", help="Decrypt from file"),
+    key_file: Optional[Path] = typer.Option(
+        None, "--key-file", "-k", envvar="REX_KEY_FILE", help="Key file from 'rex encrypt derive-key'"
+    ),
 ):
     """Decrypt data or files."""
+    key_material = _load_key_file(key_file) if key_file else None
+    if key_material is None and password is None:
+        password = typer.prompt("Password", hide_input=True)
+
     # Get input
     if file:
         if not file.exists():
             console.print(f"[red]✗ File not found: {file}[/red]")
             raise typer.Exit(1)
-        raw = file.read_text().strip()
+        with file.open("rb") as fh:
+            raw = _read_or_stream(fh, output, password, key_material)
     elif data:
-        raw = data.strip()
+        raw = data.strip().encode()
     elif not sys.stdin.isatty():
-        raw = sys.stdin.read().strip()
+        stdin = sys.stdin.buffer
+        if not hasattr(stdin, "peek"):
+            # Substituted stdin streams may be unbuffered; peek() needs a buffer
+            stdin = io.BufferedReader(stdin)
+        raw = _read_or_stream(stdin, output, password, key_material)
     else:
         console.print("[red]✗ No data provided.[/red]")
         raise typer.Exit(1)
+    if raw is None:
+        return
+
+    payload = _unpack(raw)
+    key = _resolve_key(password, key_material, payload["salt"], payload["kdf"])
 
     try:
-        payload = json.loads(base64.b64decode(raw))
+        plaintext = _decrypt_payload(payload, key)
     except Exception:
-        console.print("[red]✗ Invalid encrypted data format.[/red]")
+        console.print("[red]✗ Decryption failed. Wrong password or corrupted data.[/red]")
         raise typer.Exit(1)
 
-    algo = payload.get("alg", "")
-    salt = base64.b64decode(payload["salt"])
-    key = _derive_key(password, salt)
+    if output:
+        output.write_bytes(plaintext)
+        console.print(f"[green]✓ Decrypted data written to {output}[/green]")
+    else:
+        _show_plaintext(plaintext)
 
-    try:
-        if algo == "aes-256-gcm":
-            nonce = base64.b64decode(payload["nonce"])
-            ciphertext = base64.b64decode(payload["data"])
-            aesgcm = AESGCM(key)
-            plaintext = aesgcm.decrypt(nonce, ciphertext, None)
 
-        elif algo == "chacha20-poly1305":
-            nonce = base64.b64decode(payload["nonce"])
-            ciphertext = base64.b64decode(payload["data"])
-            chacha = ChaCha20Poly1305(key)
-            plaintext = chacha.decrypt(nonce, ciphertext, None)
+@app.command("dec-batch")
+def decrypt_batch(
+    password: Optional[str] = typer.Option(
+        None, "--password", "-p", hide_input=True, help="Decryption password (prompted)"
+    ),
+    file: Optional[Path] = typer.Option(None, "--file", "-f", help="JSON list of encrypted values (or pipe via stdin)"),
+    key_file: Optional[Path] = typer.Option(
+        None, "--key-file", "-k", envvar="REX_KEY_FILE", help="Key file from 'rex encrypt derive-key'"
+    ),
+):
+    """Decrypt a JSON list of encrypted values, deriving each distinct key only once."""
+    from rich.table import Table
 
-        elif algo == "fernet":
-            fernet_key = base64.urlsafe_b64encode(_derive_key(password, salt))
-            f = Fernet(fernet_key)
-            plaintext = f.decrypt(payload["data"].encode())
+    key_material = _load_key_file(key_file) if key_file else None
+    if key_material is None and password is None:
+        password = typer.prompt("Password", hide_input=True)
 
-        else:
-            console.print(f"[red]✗ Unknown algorithm: {algo}[/red]")
+    if file:
+        if not file.exists():
+            console.print(f"[red]✗ File not found: {file}[/red]")
             raise typer.Exit(1)
+        raw = file.read_text()
+    elif not sys.stdin.isatty():
+        raw = sys.stdin.read()
+    else:
+        console.print("[red]✗ No data provided.[/red]")
+        raise typer.Exit(1)
 
-    except Exception as e:
-        console.print(f"[red]✗ Decryption failed. Wrong password or corrupted data.[/red]")
+    try:
+        tokens = json.loads(raw)
+        if not isinstance(tokens, list):
+            raise ValueError
+    except ValueError:
+        console.print("[red]✗ Expected a JSON list of encrypted values.[/red]")
         raise typer.Exit(1)
 
-    if output:
-        output.write_bytes(plaintext)
-        console.print(f"[green]✓ Decrypted data written to {output}[/green]")
-    else:
+    table = Table(title="🔓 Decrypted", box=box.ROUNDED, border_style="green")
+    table.add_column("#", style="dim", width=4)
+    table.add_column("Plaintext", style="white")
+
+    failed = 0
+    for i, token in enumerate(tokens, 1):
         try:
-            console.print(Panel(plaintext.decode(), title="🔓 Decrypted", border_style="green", box=box.ROUNDED))
-        except UnicodeDecodeError:
-            console.print(f"[green]✓ Decrypted {len(plaintext)} bytes (binary data — use --output to save)[/green]")
+            payload = _parse_payload(str(token).strip().encode())
+            key = _key_for(password, key_material, payload["salt"], payload["kdf"])
+        except ValueError as e:
+            # A bad value fails its own row; the rest of the list is still decrypted
+            failed += 1
+            table.add_row(str(i), f"[red]✗ {e}[/red]")
+            continue
+        try:
+            plaintext = _decrypt_payload(payload, key)
+            try:
+                table.add_row(str(i), plaintext.decode())
+            except UnicodeDecodeError:
+                table.add_row(str(i), f"[dim]{len(plaintext)} bytes (binary)[/dim]")
+        except Exception:
+            failed += 1
+            table.add_row(str(i), "[red]✗ Decryption failed[/red]")
+
+    console.print(table)
+    if failed:
+        raise typer.Exit(1)
+
+
+@app.command("derive-key")
+def derive_key(
+    password: Optional[str] = typer.Option(
+        None, "--password", "-p", hide_input=True, help="Password to derive from (prompted)"
+    ),
+    output: Path = typer.Option(..., "--output", "-o", help="Key file to write (created with mode 600)"),
+):
+    """Derive a reusable key file so repeated enc/dec calls skip the KDF."""
+    if password is None:
+        password = typer.prompt("Password", hide_input=True)
+
+    salt = os.urandom(16)
+    key = _derive_key(password, salt, DEFAULT_KDF)
+    material = {"kdf": DEFAULT_KDF, "salt": base64.b64encode(salt).decode(), "key": base64.b64encode(key).decode()}
+
+    fd = os.open(output, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    if hasattr(os, "fchmod"):
+        # The mode above only applies to new files; tighten an existing one before the key goes in
+        os.fchmod(fd, 0o600)
+    with os.fdopen(fd, "w") as fh:
+        json.dump(material, fh)
+    console.print(f"[green]✓ Key written to {output}[/green]")
+    console.print("[dim]Ciphertexts made with --key-file still decrypt with the original password.[/dim]")
 
 
 @app.command("algorithms")
@@ -170,8 +619,8 @@ def list_algorithms():
     table.add_column("Key Derivation", style="white")
     table.add_column("Notes", style="dim")
 
-    table.add_row("aes-256-gcm", "PBKDF2-SHA256 (480k iterations)", "Default. NIST standard, authenticated encryption")
-    table.add_row("chacha20-poly1305", "PBKDF2-SHA256 (480k iterations)", "Fast on devices without AES hardware acceleration")
-    table.add_row("fernet", "PBKDF2-SHA256 (480k iterations)", "High-level symmetric encryption (AES-128-CBC + HMAC)")
+    table.add_row("aes-256-gcm", "scrypt (N=2^15, r=8, p=1)", "Default. NIST standard, authenticated encryption")
+    table.add_row("chacha20-poly1305", "scrypt (N=2^15, r=8, p=1)", "Fast on devices without AES hardware acceleration")
+    table.add_row("fernet", "scrypt (N=2^15, r=8, p=1)", "High-level symmetric encryption (AES-128-CBC + HMAC)")
 
     console.print(table)
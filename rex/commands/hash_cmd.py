@@ -2,67 +2,147 @@
 
 import hashlib
 import hmac as hmac_lib
+import io
+import mmap
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich import box
 
-console = Console()
+from rex._ui import console
+
 app = typer.Typer(no_args_is_help=True)
 
 ALGORITHMS = ["md5", "sha1", "sha256", "sha512", "blake2b", "blake2s"]
+# Algorithms with a built-in keyed mode, and their maximum key size in bytes
+KEYED_ALGORITHMS = {"blake2b": hashlib.blake2b.MAX_KEY_SIZE, "blake2s": hashlib.blake2s.MAX_KEY_SIZE}
 
+# Read size for streaming input through the hashers
+CHUNK_SIZE = max(io.DEFAULT_BUFFER_SIZE, 1 << 20)
+# Files at least this large are memory-mapped and hashed without being copied
+MMAP_THRESHOLD = 64 * 1024
 
-@app.command("generate")
-def generate(
-    data: Optional[str] = typer.Argument(None, help="Data to hash"),
-    algorithm: str = typer.Option("sha256", "--algo", "-a", help="Hash algorithm"),
-    file: Optional[Path] = typer.Option(None, "--file", "-f", help="Hash a file"),
-    all_algos: bool = typer.Option(False, "--all", help="Show hash for all algorithms"),
-):
-    """Generate a hash digest."""
+
+@contextmanager
+def _open_input(data: Optional[str], file: Optional[Path]) -> Iterator[tuple[BinaryIO, str]]:
+    """Open input from argument, file, or stdin as a binary stream and describe its source."""
     if file:
         if not file.exists():
             console.print(f"[red]✗ File not found: {file}[/red]")
             raise typer.Exit(1)
-        content = file.read_bytes()
-        source = str(file)
+        with file.open("rb", buffering=0) as fh:
+            if file.stat().st_size < MMAP_THRESHOLD:
+                yield fh, str(file)
+                return
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                yield mm, str(file)
     elif data:
-        content = data.encode()
-        source = f"string ({len(data)} chars)"
+        yield io.BytesIO(data.encode()), f"string ({len(data)} chars)"
     elif not sys.stdin.isatty():
-        content = sys.stdin.buffer.read()
-        source = "stdin"
+        yield sys.stdin.buffer, "stdin"
     else:
         console.print("[red]✗ No input provided.[/red]")
         raise typer.Exit(1)
 
+
+def _update(hashers: list, stream: BinaryIO) -> None:
+    """Feed a stream through every hasher in a single pass, one chunk at a time."""
+    if isinstance(stream, mmap.mmap):
+        # The mapping is already addressable, so each hasher takes it whole
+        if len(hashers) > 1:
+            with ThreadPoolExecutor(max_workers=len(hashers)) as pool:
+                list(pool.map(lambda h: h.update(stream), hashers))
+        else:
+            hashers[0].update(stream)
+        return
+    chunk = stream.read(CHUNK_SIZE)
+    if len(hashers) > 1 and len(chunk) == CHUNK_SIZE:
+        # hashlib releases the GIL on large updates, so the hashers can each
+        # take a core while the next chunk is read
+        with ThreadPoolExecutor(max_workers=len(hashers)) as pool:
+            while chunk:
+                list(pool.map(lambda h: h.update(chunk), hashers))
+                chunk = stream.read(CHUNK_SIZE)
+        return
+    while chunk:
+        for h in hashers:
+            h.update(chunk)
+        chunk = stream.read(CHUNK_SIZE)
+
+
+def _digest(algo: str, stream: BinaryIO):
+    """Hash a stream with a single algorithm."""
+    if sys.version_info >= (3, 11) and not isinstance(stream, mmap.mmap):
+        # Runs the read/update loop in C with the GIL released
+        return hashlib.file_digest(stream, algo)
+    h = hashlib.new(algo)
+    _update([h], stream)
+    return h
+
+
+def _matches(h, expected: str) -> bool:
+    """Compare a digest against an expected hex string in constant time.
+
+    Surrounding whitespace is ignored; whitespace inside the digest (which
+    bytes.fromhex would skip) makes it a mismatch.
+    """
+    expected = expected.strip()
+    if any(c.isspace() for c in expected):
+        return False
+    try:
+        return hmac_lib.compare_digest(h.digest(), bytes.fromhex(expected))
+    except ValueError:
+        return False
+
+
+@app.command("generate")
+def generate(
+    data: Optional[str] = typer.Argument(None, help="Data to hash"),
+    algorithm: str = typer.Option("sha256", "--algo", "-a", help="Hash algorithm"),
+    file: Optional[Path] = typer.Option(None, "--file", "-f", help="Hash a file"),
+    all_algos: bool = typer.Option(False, "--all", help="Show hash for all algorithms"),
+    raw: bool = typer.Option(False, "--raw", help="Print only the digest(s), without formatting"),
+):
+    """Generate a hash digest."""
+    algo = algorithm.lower()
+    if not all_algos and algo not in ALGORITHMS:
+        console.print(f"[red]✗ Unknown algorithm: {algo}. Use: {', '.join(ALGORITHMS)}[/red]")
+        raise typer.Exit(1)
+
+    with _open_input(data, file) as (stream, source):
+        if all_algos:
+            hashers = [hashlib.new(a) for a in ALGORITHMS]
+            _update(hashers, stream)
+        else:
+            digest = _digest(algo, stream).hexdigest()
+
+    if raw:
+        if all_algos:
+            typer.echo("\n".join(f"{a}  {h.hexdigest()}" for a, h in zip(ALGORITHMS, hashers)))
+        else:
+            typer.echo(digest)
+        return
+
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+
     if all_algos:
         table = Table(title=f"🔒 Hash Digests — {source}", box=box.ROUNDED, border_style="green")
         table.add_column("Algorithm", style="bold cyan", min_width=10)
         table.add_column("Digest", style="white")
 
-        for algo in ALGORITHMS:
-            h = hashlib.new(algo)
-            h.update(content)
-            table.add_row(algo.upper(), h.hexdigest())
+        for a, h in zip(ALGORITHMS, hashers):
+            table.add_row(a.upper(), h.hexdigest())
 
         console.print(table)
     else:
-        algo = algorithm.lower()
-        if algo not in ALGORITHMS:
-            console.print(f"[red]✗ Unknown algorithm: {algo}. Use: {', '.join(ALGORITHMS)}[/red]")
-            raise typer.Exit(1)
-
-        h = hashlib.new(algo)
-        h.update(content)
-        digest = h.hexdigest()
-
         console.print(Panel(
             f"[bold white]{digest}[/bold white]",
             title=f"🔒 {algo.upper()} — {source}",
@@ -77,31 +157,49 @@ def hmac_generate(
     key: str = typer.Option(..., "--key", "-k", help="HMAC secret key"),
     algorithm: str = typer.Option("sha256", "--algo", "-a", help="Hash algorithm"),
     file: Optional[Path] = typer.Option(None, "--file", "-f", help="Hash a file"),
+    expected: Optional[str] = typer.Option(None, "--expected", "-e", help="Verify against an expected HMAC instead"),
+    native: bool = typer.Option(
+        False, "--native", help="Use BLAKE2's built-in keyed mode instead of HMAC (blake2b/blake2s)"
+    ),
 ):
     """Generate an HMAC digest."""
-    if file:
-        if not file.exists():
-            console.print(f"[red]✗ File not found: {file}[/red]")
-            raise typer.Exit(1)
-        content = file.read_bytes()
-    elif data:
-        content = data.encode()
-    elif not sys.stdin.isatty():
-        content = sys.stdin.buffer.read()
-    else:
-        console.print("[red]✗ No input provided.[/red]")
-        raise typer.Exit(1)
-
     algo = algorithm.lower()
     if algo not in ALGORITHMS:
         console.print(f"[red]✗ Unknown algorithm: {algo}[/red]")
         raise typer.Exit(1)
 
-    digest = hmac_lib.new(key.encode(), content, algo).hexdigest()
+    key_bytes = key.encode()
+    if native:
+        if algo not in KEYED_ALGORITHMS:
+            console.print(f"[red]✗ --native requires one of: {', '.join(KEYED_ALGORITHMS)}[/red]")
+            raise typer.Exit(1)
+        if len(key_bytes) > KEYED_ALGORITHMS[algo]:
+            console.print(f"[red]✗ {algo.upper()} keys are at most {KEYED_ALGORITHMS[algo]} bytes[/red]")
+            raise typer.Exit(1)
+        # A single keyed hash, without HMAC's inner and outer passes
+        mac = hashlib.new(algo, key=key_bytes)
+        kind, title = "Keyed hash", f"Keyed {algo.upper()}"
+    else:
+        mac = hmac_lib.new(key_bytes, digestmod=algo)
+        kind, title = "HMAC", f"HMAC-{algo.upper()}"
+
+    with _open_input(data, file) as (stream, _):
+        _update([mac], stream)
+
+    if expected is not None:
+        if _matches(mac, expected):
+            console.print(f"[green]✓ {kind} matches! ({algo.upper()})[/green]")
+            return
+        console.print(f"[red]✗ {kind} mismatch![/red]")
+        raise typer.Exit(1)
+
+    from rich import box
+    from rich.panel import Panel
 
+    digest = mac.hexdigest()
     console.print(Panel(
         f"[bold white]{digest}[/bold white]",
-        title=f"🔒 HMAC-{algo.upper()}",
+        title=f"🔒 {title}",
         border_style="green",
         box=box.ROUNDED,
     ))
@@ -115,28 +213,18 @@ def verify(
     file: Optional[Path] = typer.Option(None, "--file", "-f", help="Verify a file"),
 ):
     """Verify data against a known hash."""
-    if file:
-        if not file.exists():
-            console.print(f"[red]✗ File not found: {file}[/red]")
-            raise typer.Exit(1)
-        content = file.read_bytes()
-    elif data:
-        content = data.encode()
-    elif not sys.stdin.isatty():
-        content = sys.stdin.buffer.read()
-    else:
-        console.print("[red]✗ No input provided.[/red]")
+    algo = algorithm.lower()
+    if algo not in ALGORITHMS:
+        console.print(f"[red]✗ Unknown algorithm: {algo}[/red]")
         raise typer.Exit(1)
 
-    algo = algorithm.lower()
-    h = hashlib.new(algo)
-    h.update(content)
-    actual = h.hexdigest()
+    with _open_input(data, file) as (stream, _):
+        h = _digest(algo, stream)
 
-    if actual == expected.lower():
+    if _matches(h, expected):
         console.print(f"[green]✓ Hash matches! ({algo.upper()})[/green]")
     else:
         console.print(f"[red]✗ Hash mismatch![/red]")
         console.print(f"  [dim]Expected: {expected}[/dim]")
-        console.print(f"  [dim]Actual:   {actual}[/dim]")
+        console.print(f"  [dim]Actual:   {h.hexdigest()}[/dim]")
         raise typer.Exit(1)
@@ -1,36 +1,106 @@
 """JSON beautify, minify, validate & query operations."""
 
+import importlib.util
 import json
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
-from rich.syntax import Syntax
 from rich import box
 
-console = Console()
+from rex._jsonio import dumpb, dumps, loads
+from rex._ui import code_view, console
+
+try:
+    # SIMD parser that can validate a document without building Python objects
+    import simdjson
+except ImportError:
+    simdjson = None
+
 app = typer.Typer(no_args_is_help=True)
 
+# JMESPath expressions made only of field names and non-negative indexes
+# (e.g. "results[0].id"), which can be answered by walking lazy proxies
+_SIMPLE_PATH = re.compile(r"(?:[A-Za-z_][A-Za-z0-9_]*|\[[0-9]+\])(?:\.[A-Za-z_][A-Za-z0-9_]*|\[[0-9]+\])*")
+_PATH_STEP = re.compile(r"([A-Za-z_][A-Za-z0-9_]*)|\[([0-9]+)\]")
+
+# One simdjson parser is reused for every document (its buffers are kept between parses)
+_PARSER = simdjson.Parser() if simdjson else None
+_OBJECT_TYPES = (dict, simdjson.Object) if simdjson else (dict,)
+_ARRAY_TYPES = (list, simdjson.Array) if simdjson else (list,)
+
 
-def _read_input(data: Optional[str], file: Optional[Path]) -> str:
-    """Read JSON input from argument, file, or stdin."""
+def _read_input(data: Optional[str], file: Optional[Path]) -> bytes:
+    """Read JSON input from argument, file, or stdin as undecoded bytes.
+
+    Every parser here takes bytes directly, so the input is never held as a
+    decoded str as well.
+    """
     if file:
         if not file.exists():
             console.print(f"[red]✗ File not found: {file}[/red]")
             raise typer.Exit(1)
-        return file.read_text()
+        return file.read_bytes()
     elif data:
-        return data
+        return data.encode()
     elif not sys.stdin.isatty():
-        return sys.stdin.read()
+        return sys.stdin.buffer.read()
     else:
         console.print("[red]✗ No input. Pass JSON as argument, --file, or pipe via stdin.[/red]")
         raise typer.Exit(1)
 
 
+def _describe(parsed) -> str:
+    """Summarize a parsed document's top level for validate."""
+    if isinstance(parsed, dict):
+        return f"{len(parsed)} keys"
+    elif isinstance(parsed, _OBJECT_TYPES):
+        # simdjson keeps duplicate keys, which the stdlib collapses to the last one
+        return f"{len(set(parsed.keys()))} keys"
+    elif isinstance(parsed, _ARRAY_TYPES):
+        return f"{len(parsed)} items"
+    return "float" if isinstance(parsed, float) else type(parsed).__name__
+
+
+def _lazy_search(raw: bytes, expression: str):
+    """Evaluate a simple field/index path with simdjson, materializing only the result.
+
+    Mirrors JMESPath: a missing key, an out-of-range index or a step into the
+    wrong type yields None. simdjson returns the first of duplicate keys where
+    the stdlib keeps the last, so a duplicated key on the path raises
+    ValueError and the caller falls back to a full parse.
+    """
+    node = _PARSER.parse(raw)
+    for name, index in _PATH_STEP.findall(expression):
+        if name:
+            if not isinstance(node, _OBJECT_TYPES) or name not in node:
+                return None
+            if list(node.keys()).count(name) > 1:
+                raise ValueError(f"duplicate key: {name}")
+            node = node[name]
+        else:
+            if not isinstance(node, _ARRAY_TYPES) or int(index) >= len(node):
+                return None
+            node = node[int(index)]
+    if isinstance(node, _OBJECT_TYPES):
+        return node.as_dict()
+    elif isinstance(node, _ARRAY_TYPES):
+        return node.as_list()
+    return node
+
+
+@lru_cache(maxsize=128)
+def _compile_query(expression: str):
+    """Compile a JMESPath expression once; repeated queries reuse the parsed AST."""
+    import jmespath
+
+    return jmespath.compile(expression)
+
+
 @app.command("beautify")
 def beautify(
     data: Optional[str] = typer.Argument(None, help="JSON string"),
@@ -38,22 +108,22 @@ def beautify(
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Write to file"),
     indent: int = typer.Option(2, "--indent", "-i", help="Indentation spaces"),
     sort_keys: bool = typer.Option(False, "--sort-keys", "-s", help="Sort object keys"),
+    highlight: bool = typer.Option(True, "--highlight/--no-highlight", help="Syntax-highlight the output"),
 ):
     """Beautify / pretty-print JSON."""
     raw = _read_input(data, file)
     try:
-        parsed = json.loads(raw)
+        parsed = loads(raw)
     except json.JSONDecodeError as e:
         console.print(f"[red]✗ Invalid JSON: {e}[/red]")
         raise typer.Exit(1)
 
-    result = json.dumps(parsed, indent=indent, sort_keys=sort_keys, ensure_ascii=False)
-
     if output:
-        output.write_text(result)
+        output.write_bytes(dumpb(parsed, indent=indent, sort_keys=sort_keys))
         console.print(f"[green]✓ Beautified JSON written to {output}[/green]")
     else:
-        syntax = Syntax(result, "json", theme="monokai", line_numbers=True)
+        result = dumps(parsed, indent=indent, sort_keys=sort_keys)
+        syntax = code_view(result, "json", line_numbers=True, highlight=highlight)
         console.print(Panel(syntax, title="📋 Beautified JSON", border_style="green", box=box.ROUNDED))
 
 
@@ -66,18 +136,16 @@ def minify(
     """Minify JSON (remove whitespace)."""
     raw = _read_input(data, file)
     try:
-        parsed = json.loads(raw)
+        parsed = loads(raw)
     except json.JSONDecodeError as e:
         console.print(f"[red]✗ Invalid JSON: {e}[/red]")
         raise typer.Exit(1)
 
-    result = json.dumps(parsed, separators=(",", ":"), ensure_ascii=False)
-
     if output:
-        output.write_text(result)
+        output.write_bytes(dumpb(parsed))
         console.print(f"[green]✓ Minified JSON written to {output}[/green]")
     else:
-        console.print(Panel(result, title="📋 Minified JSON", border_style="green", box=box.ROUNDED))
+        console.print(Panel(dumps(parsed), title="📋 Minified JSON", border_style="green", box=box.ROUNDED))
 
 
 @app.command("validate")
@@ -87,16 +155,17 @@ def validate(
 ):
     """Validate JSON syntax."""
     raw = _read_input(data, file)
+    if _PARSER is not None:
+        try:
+            # Lazy proxies: only the top-level length is read, nothing is materialized
+            console.print(f"[green]✓ Valid JSON ({_describe(_PARSER.parse(raw))})[/green]")
+            return
+        except (ValueError, RuntimeError):
+            # Invalid for simdjson; the stdlib decides and reports line/column
+            pass
     try:
-        parsed = json.loads(raw)
-        obj_type = type(parsed).__name__
-        if isinstance(parsed, dict):
-            detail = f"{len(parsed)} keys"
-        elif isinstance(parsed, list):
-            detail = f"{len(parsed)} items"
-        else:
-            detail = obj_type
-        console.print(f"[green]✓ Valid JSON ({detail})[/green]")
+        parsed = loads(raw)
+        console.print(f"[green]✓ Valid JSON ({_describe(parsed)})[/green]")
     except json.JSONDecodeError as e:
         console.print(f"[red]✗ Invalid JSON at line {e.lineno}, column {e.colno}: {e.msg}[/red]")
         raise typer.Exit(1)
@@ -107,29 +176,37 @@ def query(
     expression: str = typer.Argument(..., help="JMESPath query expression"),
     data: Optional[str] = typer.Option(None, "--data", "-d", help="JSON string"),
     file: Optional[Path] = typer.Option(None, "--file", "-f", help="Read from file"),
+    highlight: bool = typer.Option(True, "--highlight/--no-highlight", help="Syntax-highlight the output"),
 ):
     """Query JSON with JMESPath expressions."""
-    try:
-        import jmespath
-    except ImportError:
+    # Only checked here: simple paths are answered by simdjson without importing jmespath
+    if importlib.util.find_spec("jmespath") is None:
         console.print("[red]✗ jmespath not installed. Run: pip install rex-cli[query][/red]")
         raise typer.Exit(1)
 
     if file:
-        raw = file.read_text() if file.exists() else ""
+        raw = file.read_bytes() if file.exists() else b""
     elif data:
-        raw = data
+        raw = data.encode()
     elif not sys.stdin.isatty():
-        raw = sys.stdin.read()
+        raw = sys.stdin.buffer.read()
     else:
         console.print("[red]✗ No input provided.[/red]")
         raise typer.Exit(1)
 
     try:
-        parsed = json.loads(raw)
-        result = jmespath.search(expression, parsed)
-        formatted = json.dumps(result, indent=2, ensure_ascii=False)
-        syntax = Syntax(formatted, "json", theme="monokai")
+        result = None
+        lazy = _PARSER is not None and _SIMPLE_PATH.fullmatch(expression)
+        if lazy:
+            try:
+                result = _lazy_search(raw, expression)
+            except (ValueError, RuntimeError):
+                # Not something simdjson can handle; parse it the usual way
+                lazy = False
+        if not lazy:
+            result = _compile_query(expression).search(loads(raw))
+        formatted = dumps(result, indent=2)
+        syntax = code_view(formatted, "json", highlight=highlight)
         console.print(Panel(syntax, title=f"🔍 Query: {expression}", border_style="cyan", box=box.ROUNDED))
     except json.JSONDecodeError as e:
         console.print(f"[red]✗ Invalid JSON: {e}[/red]")
@@ -7,23 +7,26 @@ from datetime import datetime, timezone
 from typing import Optional
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
-from rich.syntax import Syntax
 from rich.table import Table
 from rich import box
 
-console = Console()
+from rex._ui import code_view, console
+
 app = typer.Typer(no_args_is_help=True)
 
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S UTC"
+
 
 def _b64decode_jwt(data: str) -> dict:
     """Decode a JWT segment (handles missing padding)."""
-    padding = 4 - len(data) % 4
-    if padding != 4:
-        data += "=" * padding
-    decoded = base64.urlsafe_b64decode(data)
-    return json.loads(decoded)
+    # json.loads takes the decoded bytes directly, without a str round-trip
+    return json.loads(base64.urlsafe_b64decode(data.encode() + b"==="[:-len(data) % 4]))
+
+
+def _claim_time(value) -> datetime:
+    """Convert a NumericDate claim (seconds since the epoch) to an aware UTC datetime."""
+    return datetime.fromtimestamp(value, tz=timezone.utc)
 
 
 @app.command("decode")
@@ -53,7 +56,7 @@ def decode(
     # Header
     header_json = json.dumps(header, indent=2)
     console.print(Panel(
-        Syntax(header_json, "json", theme="monokai"),
+        code_view(header_json, "json"),
         title="🎫 JWT Header",
         border_style="cyan",
         box=box.ROUNDED,
@@ -62,7 +65,7 @@ def decode(
     # Payload
     payload_json = json.dumps(payload, indent=2)
     console.print(Panel(
-        Syntax(payload_json, "json", theme="monokai"),
+        code_view(payload_json, "json"),
         title="🎫 JWT Payload",
         border_style="green",
         box=box.ROUNDED,
@@ -84,19 +87,15 @@ def decode(
         table.add_row("Audience", str(payload["aud"]))
 
     if "iat" in payload:
-        iat = datetime.fromtimestamp(payload["iat"], tz=timezone.utc)
-        table.add_row("Issued At", iat.strftime("%Y-%m-%d %H:%M:%S UTC"))
+        table.add_row("Issued At", _claim_time(payload["iat"]).strftime(TIME_FORMAT))
 
     if "exp" in payload:
-        exp = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
-        now = datetime.now(tz=timezone.utc)
-        is_expired = now > exp
-        status = "[red]EXPIRED[/red]" if is_expired else "[green]VALID[/green]"
-        table.add_row("Expires", f"{exp.strftime('%Y-%m-%d %H:%M:%S UTC')} ({status})")
+        exp = _claim_time(payload["exp"])
+        status = "[red]EXPIRED[/red]" if datetime.now(tz=timezone.utc) > exp else "[green]VALID[/green]"
+        table.add_row("Expires", f"{exp.strftime(TIME_FORMAT)} ({status})")
 
     if "nbf" in payload:
-        nbf = datetime.fromtimestamp(payload["nbf"], tz=timezone.utc)
-        table.add_row("Not Before", nbf.strftime("%Y-%m-%d %H:%M:%S UTC"))
+        table.add_row("Not Before", _claim_time(payload["nbf"]).strftime(TIME_FORMAT))
 
     table.add_row("Signature", f"{'Present' if len(parts) == 3 else 'None'} ({len(parts[-1])} chars)")
 
@@ -1,18 +1,101 @@
 """Network utilities — DNS lookup, port check, headers."""
 
+import os
+import re
 import socket
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from typing import Optional
 
 import typer
-from rich.console import Console
 from rich.table import Table
 from rich import box
 
-console = Console()
+from rex._ui import console
+
 app = typer.Typer(no_args_is_help=True)
 
+# Upper bound on ports probed at the same time by `net port`
+MAX_PORT_WORKERS = 256
+
+# One entry of a port list: a single port ("443") or an inclusive range ("8000-8010")
+_PORT_SPEC = re.compile(r"\s*([0-9]+)\s*(?:-\s*([0-9]+)\s*)?")
+
+
+def _parse_ports(spec: str) -> list[int]:
+    """Expand "80,443,8000-8010" into sorted, de-duplicated port numbers."""
+    ports = set()
+    for part in spec.split(","):
+        match = _PORT_SPEC.fullmatch(part)
+        if not match:
+            raise ValueError(f"invalid port or range: {part.strip()!r}")
+        start = int(match[1])
+        end = int(match[2]) if match[2] else start
+        if not 1 <= start <= end <= 65535:
+            raise ValueError(f"ports must be 1-65535 in ascending order: {part.strip()!r}")
+        ports.update(range(start, end + 1))
+    return sorted(ports)
+
+
+@cache
+def _tcp_services() -> Optional[dict[int, str]]:
+    """Map TCP ports to service names from /etc/services, read once; None where it is unavailable."""
+    services: dict[int, str] = {}
+    try:
+        with open("/etc/services", encoding="utf-8", errors="replace") as fh:
+            for line in fh:
+                fields = line.split("#", 1)[0].split()
+                if len(fields) < 2:
+                    continue
+                port, _, proto = fields[1].partition("/")
+                if proto == "tcp" and port.isdigit():
+                    # The first entry for a port is its primary name, as with getservbyport
+                    services.setdefault(int(port), fields[0])
+    except OSError:
+        return None
+    return services
+
+
+def _service_name(port: int) -> str:
+    """Name the well-known TCP service on a port, or "unknown"."""
+    services = _tcp_services()
+    if services is not None:
+        return services.get(port, "unknown")
+    try:
+        return socket.getservbyport(port, "tcp")
+    except OSError:
+        return "unknown"
+
+
+def _resolve(hostname: str, record_type: str) -> Optional[list[str]]:
+    """Query records in-process with dnspython; None when it is not installed."""
+    try:
+        import dns.exception
+        import dns.resolver
+    except ImportError:
+        return None
+    try:
+        answer = dns.resolver.resolve(hostname, record_type, lifetime=10)
+    except dns.exception.DNSException:
+        return []
+    return [rdata.to_text() for rdata in answer]
+
+
+def _icmp_ping(host: str, count: int):
+    """Ping with icmplib instead of the ping binary; None when it is missing or ICMP is not permitted."""
+    try:
+        import icmplib
+    except ImportError:
+        return None
+    # Unprivileged ICMP sockets need OS support; root can always open a raw socket
+    privileged = hasattr(os, "geteuid") and os.geteuid() == 0
+    try:
+        return icmplib.ping(host, count=count, privileged=privileged)
+    except icmplib.SocketPermissionError:
+        return None
+
 
 @app.command("dns")
 def dns_lookup(
@@ -38,8 +121,14 @@ def dns_lookup(
             except socket.gaierror:
                 console.print(f"[yellow]No {record_type.upper()} records found.[/yellow]")
                 return
+        elif (records := _resolve(hostname, record_type.upper())) is not None:
+            if not records:
+                console.print(f"[yellow]No {record_type.upper()} records found.[/yellow]")
+                return
+            for record in records:
+                table.add_row(record_type.upper(), record)
         else:
-            # For MX, NS, TXT etc - try using dig/nslookup if available
+            # Without dnspython, try using dig/nslookup if available
             try:
                 result = subprocess.run(
                     ["dig", "+short", hostname, record_type.upper()],
@@ -76,40 +165,46 @@ def port_check(
     timeout: float = typer.Option(2.0, "--timeout", "-t", help="Timeout in seconds"),
 ):
     """Check if ports are open on a host."""
-    port_list = []
-    for part in ports.split(","):
-        part = part.strip()
-        if "-" in part:
-            start, end = part.split("-")
-            port_list.extend(range(int(start), int(end) + 1))
-        else:
-            port_list.append(int(part))
+    try:
+        ordered = _parse_ports(ports)
+    except ValueError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        raise typer.Exit(1)
 
     table = Table(title=f"🔌 Port Check — {host}", box=box.ROUNDED, border_style="green")
     table.add_column("Port", style="bold cyan", min_width=8)
     table.add_column("Status", style="white")
     table.add_column("Service", style="dim")
 
-    for port in sorted(port_list):
+    # Resolve once up front instead of once per probed port. IPv4 is preferred
+    # (hosts such as localhost often list ::1 first, where IPv4-only services
+    # would look closed); IPv6 is used only for hosts without an IPv4 address.
+    try:
+        addresses = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+        family, socktype, proto, _, sockaddr = min(addresses, key=lambda a: a[0] != socket.AF_INET)
+    except socket.gaierror:
+        console.print(f"[red]✗ Cannot resolve host: {host}[/red]")
+        raise typer.Exit(1)
+
+    def probe(port: int) -> tuple[str, str]:
+        # Only a failed connect means CLOSED; anything else (such as running out
+        # of file descriptors on a wide scan) is reported as an ERROR row
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            result = sock.connect_ex((host, port))
-            sock.close()
-
-            if result == 0:
-                try:
-                    service = socket.getservbyport(port)
-                except OSError:
-                    service = "unknown"
-                table.add_row(str(port), "[green]● OPEN[/green]", service)
-            else:
-                table.add_row(str(port), "[red]● CLOSED[/red]", "—")
-        except socket.gaierror:
-            console.print(f"[red]✗ Cannot resolve host: {host}[/red]")
-            raise typer.Exit(1)
+            with socket.socket(family, socktype, proto) as sock:
+                sock.settimeout(timeout)
+                # IPv6 addresses carry flow info and scope id after the port
+                if sock.connect_ex((sockaddr[0], port, *sockaddr[2:])):
+                    return "[red]● CLOSED[/red]", "—"
         except Exception as e:
-            table.add_row(str(port), f"[yellow]● ERROR[/yellow]", str(e))
+            return "[yellow]● ERROR[/yellow]", str(e)
+        return "[green]● OPEN[/green]", _service_name(port)
+
+    # Each probe mostly waits on the network, so they run side by side
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_PORT_WORKERS, len(ordered)))) as pool:
+        results = list(pool.map(probe, ordered))
+
+    for port, (status, service) in zip(ordered, results):
+        table.add_row(str(port), status, service)
 
     console.print(table)
 
@@ -120,6 +215,28 @@ def ping(
     count: int = typer.Option(4, "--count", "-c", help="Number of pings"),
 ):
     """Ping a host."""
+    try:
+        host_result = _icmp_ping(host, count)
+    except Exception as e:
+        console.print(f"[red]✗ {host} is unreachable[/red]\n")
+        console.print(str(e))
+        raise typer.Exit(1)
+    if host_result is not None:
+        summary = (
+            f"{host_result.packets_sent} packets transmitted, {host_result.packets_received} received, "
+            f"{host_result.packet_loss:.0%} packet loss"
+        )
+        if host_result.is_alive:
+            console.print(f"[green]✓ {host} is reachable[/green]\n")
+            console.print(summary)
+            console.print(
+                f"rtt min/avg/max = {host_result.min_rtt:.3f}/{host_result.avg_rtt:.3f}/{host_result.max_rtt:.3f} ms"
+            )
+            return
+        console.print(f"[red]✗ {host} is unreachable[/red]\n")
+        console.print(summary)
+        raise typer.Exit(1)
+
     flag = "-c" if sys.platform != "win32" else "-n"
     try:
         result = subprocess.run(
@@ -5,16 +5,37 @@ import string
 from typing import Optional
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich import box
 
-console = Console()
+from rex._ui import console
+
 app = typer.Typer(no_args_is_help=True)
 
+SYMBOLS = "!@#$%^&*()-_=+[]{}|;:,.<>?"
+
+
+def _random_indices(n: int, size: int) -> list[int]:
+    """Return n uniform random indices into a sequence of the given size.
+
+    Random bytes are fetched in batches and masked to the next power of two;
+    values past the end are rejected rather than wrapped, so there is no
+    modulo bias (and nothing is rejected when size is a power of two).
+    """
+    bits = (size - 1).bit_length()
+    width = 1 if bits <= 8 else 2 if bits <= 16 else 4
+    mask = (1 << bits) - 1
+    picks: list[int] = []
+    while len(picks) < n:
+        # At least half of all draws are accepted, so twice the shortfall usually suffices
+        buf = secrets.token_bytes((n - len(picks)) * 2 * width)
+        values = buf if width == 1 else memoryview(buf).cast("H" if width == 2 else "I")
+        picks += [v for v in map(mask.__and__, values) if v < size]
+    return picks[:n]
+
 # EFF large wordlist (subset for passphrases)
-WORDLIST = [
+WORDLIST = (
     "abandon", "ability", "abstract", "academy", "access", "accident", "account",
     "achieve", "acoustic", "acquire", "across", "action", "adapt", "address",
     "adjust", "admiral", "advance", "advice", "aerobic", "afford", "again",
@@ -118,7 +139,8 @@ WORDLIST = [
     "voyage", "vulture", "walnut", "warrior", "weather", "wedding", "welcome",
     "western", "whisper", "wicked", "window", "winner", "winter", "wisdom",
     "witness", "wonder", "wrestle", "zombie",
-]
+)
+_WORDLIST_LEN = len(WORDLIST)
 
 
 @app.command("generate")
@@ -140,10 +162,10 @@ def generate(
     if digits:
         charset += string.digits
     if symbols:
-        charset += "!@#$%^&*()-_=+[]{}|;:,.<>?"
+        charset += SYMBOLS
 
     if exclude:
-        charset = "".join(c for c in charset if c not in exclude)
+        charset = charset.translate(str.maketrans("", "", exclude))
 
     if not charset:
         console.print("[red]✗ No characters available with current settings.[/red]")
@@ -154,17 +176,21 @@ def generate(
     table.add_column("Password", style="bold white")
     table.add_column("Strength", style="cyan")
 
+    # Every password has the same length and charset, so they share a strength rating
+    entropy = length * len(charset).bit_length()
+    if entropy >= 128:
+        strength = "[green]● Excellent[/green]"
+    elif entropy >= 80:
+        strength = "[yellow]● Good[/yellow]"
+    elif entropy >= 60:
+        strength = "[yellow]● Fair[/yellow]"
+    else:
+        strength = "[red]● Weak[/red]"
+
+    # One batch of random bytes covers every password
+    picks = _random_indices(length * count, len(charset))
     for i in range(count):
-        pw = "".join(secrets.choice(charset) for _ in range(length))
-        entropy = len(pw) * (len(charset).bit_length())
-        if entropy >= 128:
-            strength = "[green]● Excellent[/green]"
-        elif entropy >= 80:
-            strength = "[yellow]● Good[/yellow]"
-        elif entropy >= 60:
-            strength = "[yellow]● Fair[/yellow]"
-        else:
-            strength = "[red]● Weak[/red]"
+        pw = "".join(map(charset.__getitem__, picks[i * length:(i + 1) * length]))
         table.add_row(str(i + 1), pw, strength)
 
     console.print(table)
@@ -182,12 +208,13 @@ def passphrase(
     table.add_column("#", style="dim", width=4)
     table.add_column("Passphrase", style="bold white")
 
+    # One batch of random bytes covers every passphrase, as in generate
+    picks = _random_indices(words * count, _WORDLIST_LEN)
     for i in range(count):
-        chosen = [secrets.choice(WORDLIST) for _ in range(words)]
+        chosen = map(WORDLIST.__getitem__, picks[i * words:(i + 1) * words])
         if capitalize:
-            chosen = [w.capitalize() for w in chosen]
-        phrase = separator.join(chosen)
-        table.add_row(str(i + 1), phrase)
+            chosen = map(str.capitalize, chosen)
+        table.add_row(str(i + 1), separator.join(chosen))
 
     console.print(table)
-    console.print(f"[dim]Entropy: ~{int(words * 11)} bits ({len(WORDLIST)} word pool)[/dim]")
+    console.print(f"[dim]Entropy: ~{int(words * 11)} bits ({_WORDLIST_LEN} word pool)[/dim]")
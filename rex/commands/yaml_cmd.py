@@ -1,33 +1,118 @@
 """YAML lint, validate & convert operations."""
 
 import json
+import math
+import re
 import sys
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich import box
-
 import yaml
 
-console = Console()
+from rex._jsonio import NonFinite, dumpb, dumps, loads
+from rex._ui import code_view, console
+
+try:
+    # LibYAML bindings; the pure-Python loader and dumper are used without them
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 app = typer.Typer(no_args_is_help=True)
 
 
-def _read_input(data: Optional[str], file: Optional[Path]) -> str:
-    """Read input from argument, file, or stdin."""
+class _JSONLoader(SafeLoader):
+    """SafeLoader for to-json that marks .nan/.inf so they are written as NaN/Infinity, as the stdlib does."""
+
+
+def _construct_float(loader: SafeLoader, node) -> float:
+    value = loader.construct_yaml_float(node)
+    return value if math.isfinite(value) else NonFinite(value)
+
+
+_JSONLoader.add_constructor("tag:yaml.org,2002:float", _construct_float)
+
+# Documents that open with a JSON array or object are tried as JSON first
+_JSON_START = re.compile(rb"[ \t\r\n]*[\[{]")
+# Documents containing any of these go through the YAML loader, which reads
+# them differently from a JSON parser or rejects them: tabs outside strings;
+# DEL, C1 controls (YAML folds NEL to a space) and U+FFFE/U+FFFF, which YAML
+# does not allow unescaped; surrogate escapes; exponents, which YAML 1.1 reads
+# as strings unless written like 1.5e+3; and NUL, which makes the stdlib
+# parser guess UTF-16/32. Each pattern starts with a literal so the regex
+# engine can scan for it quickly; one combined pattern is several times slower.
+_JSON_DIVERGES = tuple(re.compile(pattern) for pattern in (
+    rb"\t",
+    rb"\x00",
+    rb"\x7f",
+    rb"\xc2[\x80-\x9f]",
+    rb"\xef\xbf[\xbe\xbf]",
+    rb"\\u[dD][89a-fA-F]",
+    rb"e(?<=[0-9]e)[-+]?[0-9]",
+    rb"E(?<=[0-9]E)[-+]?[0-9]",
+))
+
+
+def _not_yaml(name: str):
+    # NaN/Infinity are JSON extensions that YAML reads as plain strings
+    raise ValueError(f"{name} is not a YAML value")
+
+
+def _load(raw: bytes, loader: type = SafeLoader):
+    """Parse a single YAML document, taking the JSON parser's fast path when it is plain JSON.
+
+    JSON is (nearly) a subset of YAML, and a JSON parser gets through it many
+    times faster than LibYAML; anything it rejects, or that YAML could read
+    differently, goes to the YAML loader.
+    """
+    if _JSON_START.match(raw) and not any(pattern.search(raw) for pattern in _JSON_DIVERGES):
+        try:
+            return loads(raw, parse_constant=_not_yaml)
+        except ValueError:
+            pass
+    return yaml.load(raw, Loader=loader)
+
+# Zero-width match at the start of a line containing a tab, or the run of
+# whitespace ending a line that has other content (a CRLF line ending's \r
+# is not counted as trailing whitespace)
+_WHITESPACE_ISSUE = re.compile(rb"^(?=[^\n]*\t)|(?<=\S)[^\S\r\n]+(?=\r?$)", re.MULTILINE)
+
+
+# Lint warning kinds and their messages; warnings are kept as (line, kind) until printed
+WARNING_MESSAGES = {
+    "tab": "Tab character found (use spaces)",
+    "trailing": "Trailing whitespace",
+}
+
+
+def _whitespace_warnings(content: bytes) -> list[tuple[int, str]]:
+    """Find lines with tabs or trailing whitespace in one regex pass over the text."""
+    warnings = []
+    line, pos = 1, 0
+    for match in _WHITESPACE_ISSUE.finditer(content):
+        # Line numbers are only worked out for the (few) offending lines
+        line += content.count(b"\n", pos, match.start())
+        pos = match.start()
+        warnings.append((line, "trailing" if match.group() else "tab"))
+    return warnings
+
+
+def _read_input(data: Optional[str], file: Optional[Path]) -> bytes:
+    """Read input from argument, file, or stdin as undecoded bytes.
+
+    LibYAML and the JSON parsers read bytes directly (detecting the encoding
+    themselves), so the input is never decoded into a second full-size str.
+    """
     if file:
         if not file.exists():
             console.print(f"[red]✗ File not found: {file}[/red]")
             raise typer.Exit(1)
-        return file.read_text()
+        return file.read_bytes()
     elif data:
-        return data
+        return data.encode()
     elif not sys.stdin.isatty():
-        return sys.stdin.read()
+        return sys.stdin.buffer.read()
     else:
         console.print("[red]✗ No input. Pass YAML as argument, --file, or pipe via stdin.[/red]")
         raise typer.Exit(1)
@@ -43,13 +128,14 @@ def lint(
         console.print(f"[red]✗ File not found: {file}[/red]")
         raise typer.Exit(1)
 
-    content = file.read_text()
+    content = file.read_bytes()
     errors = []
-    warnings = []
 
+    doc_count = 0
     try:
-        docs = list(yaml.safe_load_all(content))
-        doc_count = len(docs)
+        # Each document is constructed (so tag errors are caught) and dropped
+        for _ in yaml.load_all(content, Loader=SafeLoader):
+            doc_count += 1
     except yaml.YAMLError as e:
         if hasattr(e, "problem_mark"):
             mark = e.problem_mark
@@ -58,23 +144,18 @@ def lint(
             errors.append(str(e))
         doc_count = 0
 
-    # Check common issues
-    lines = content.split("\n")
-    for i, line in enumerate(lines, 1):
-        if "\t" in line:
-            warnings.append(f"Line {i}: Tab character found (use spaces)")
-        if line.rstrip() != line and line.strip():
-            warnings.append(f"Line {i}: Trailing whitespace")
+    # Whitespace issues are only reported in strict mode, so only looked for there
+    warnings = _whitespace_warnings(content) if strict and not errors else []
 
     if errors:
         console.print(f"[red]✗ {file.name} — {len(errors)} error(s)[/red]")
         for err in errors:
             console.print(f"  [red]• {err}[/red]")
         raise typer.Exit(1)
-    elif warnings and strict:
+    elif warnings:
         console.print(f"[yellow]⚠ {file.name} — Valid with {len(warnings)} warning(s)[/yellow]")
-        for warn in warnings:
-            console.print(f"  [yellow]• {warn}[/yellow]")
+        for line, kind in warnings:
+            console.print(f"  [yellow]• Line {line}: {WARNING_MESSAGES[kind]}[/yellow]")
     else:
         console.print(f"[green]✓ {file.name} — Valid YAML ({doc_count} document(s))[/green]")
 
@@ -87,7 +168,7 @@ def validate(
     """Validate YAML syntax."""
     raw = _read_input(data, file)
     try:
-        parsed = yaml.safe_load(raw)
+        parsed = _load(raw)
         console.print(f"[green]✓ Valid YAML (type: {type(parsed).__name__})[/green]")
     except yaml.YAMLError as e:
         console.print(f"[red]✗ Invalid YAML: {e}[/red]")
@@ -100,18 +181,21 @@ def to_json(
     file: Optional[Path] = typer.Option(None, "--file", "-f", help="Read from file"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Write to file"),
     indent: int = typer.Option(2, "--indent", "-i", help="JSON indentation"),
+    highlight: bool = typer.Option(True, "--highlight/--no-highlight", help="Syntax-highlight the output"),
 ):
     """Convert YAML to JSON."""
     raw = _read_input(data, file)
     try:
-        parsed = yaml.safe_load(raw)
-        result = json.dumps(parsed, indent=indent, ensure_ascii=False)
+        parsed = _load(raw, _JSONLoader)
 
         if output:
-            output.write_text(result)
+            output.write_bytes(dumpb(parsed, indent=indent))
             console.print(f"[green]✓ JSON written to {output}[/green]")
         else:
-            syntax = Syntax(result, "json", theme="monokai", line_numbers=True)
+            from rich import box
+            from rich.panel import Panel
+
+            syntax = code_view(dumps(parsed, indent=indent), "json", line_numbers=True, highlight=highlight)
             console.print(Panel(syntax, title="📄 YAML → JSON", border_style="green", box=box.ROUNDED))
     except yaml.YAMLError as e:
         console.print(f"[red]✗ Invalid YAML: {e}[/red]")
@@ -123,18 +207,23 @@ def from_json(
     data: Optional[str] = typer.Argument(None, help="JSON string"),
     file: Optional[Path] = typer.Option(None, "--file", "-f", help="Read JSON from file"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Write to file"),
+    highlight: bool = typer.Option(True, "--highlight/--no-highlight", help="Syntax-highlight the output"),
 ):
     """Convert JSON to YAML."""
     raw = _read_input(data, file)
     try:
-        parsed = json.loads(raw)
-        result = yaml.dump(parsed, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        parsed = loads(raw, parse_constant=float)
+        options = dict(Dumper=SafeDumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
 
         if output:
-            output.write_text(result)
+            # With an encoding, the emitter produces UTF-8 bytes itself
+            output.write_bytes(yaml.dump(parsed, encoding="utf-8", **options))
             console.print(f"[green]✓ YAML written to {output}[/green]")
         else:
-            syntax = Syntax(result, "yaml", theme="monokai", line_numbers=True)
+            from rich import box
+            from rich.panel import Panel
+
+            syntax = code_view(yaml.dump(parsed, **options), "yaml", line_numbers=True, highlight=highlight)
             console.print(Panel(syntax, title="📄 JSON → YAML", border_style="green", box=box.ROUNDED))
     except json.JSONDecodeError as e:
         console.print(f"[red]✗ Invalid JSON: {e}[/red]")
@@ -1,6 +1,9 @@
 """Basic tests for Rex CLI commands."""
 
 import json
+import os
+
+import pytest
 from typer.testing import CliRunner
 from rex.cli import app
 
@@ -18,6 +21,197 @@ class TestVersion:
         assert result.exit_code == 0
         assert "Available Commands" in result.output
 
+    def test_command_modules_load_lazily(self):
+        import subprocess
+        import sys
+        code = (
+            "import sys; from typer.testing import CliRunner; from rex.cli import app; "
+            "CliRunner().invoke(app, ['version']); "
+            "print(sorted(m for m in sys.modules if m.startswith('rex.commands.')))"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        assert out.strip() == "[]"
+
+    def test_raw_output_skips_rich(self):
+        import subprocess
+        import sys
+        code = (
+            "import sys; from typer.testing import CliRunner; from rex.cli import app; "
+            "result = CliRunner().invoke(app, ['hash', 'generate', 'abc', '--raw']); "
+            "print(result.output.strip(), 'rich.console' in sys.modules)"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        assert out.split() == ["ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad", "False"]
+
+
+class TestEncrypt:
+    @pytest.fixture(autouse=True)
+    def cheap_kdf(self, monkeypatch):
+        # Payloads record their own scrypt cost, so a lower one still round-trips
+        from rex.commands import encrypt_cmd
+        monkeypatch.setitem(encrypt_cmd.DEFAULT_KDF, "n", 2**10)
+
+    @pytest.mark.parametrize("algo", ["aes-256-gcm", "chacha20-poly1305", "fernet"])
+    def test_roundtrip(self, tmp_path, algo):
+        enc_path = tmp_path / f"{algo}.enc"
+        result = runner.invoke(app, ["encrypt", "enc", "s3cret", "-p", "pw", "-a", algo, "-o", str(enc_path)])
+        assert result.exit_code == 0
+        result = runner.invoke(app, ["encrypt", "dec", "-p", "pw", "--file", str(enc_path)])
+        assert result.exit_code == 0
+        assert "s3cret" in result.output
+
+    def test_wrong_password(self, tmp_path):
+        enc_path = tmp_path / "data.enc"
+        runner.invoke(app, ["encrypt", "enc", "s3cret", "-p", "pw", "-o", str(enc_path)])
+        result = runner.invoke(app, ["encrypt", "dec", "-p", "nope", "--file", str(enc_path)])
+        assert result.exit_code == 1
+
+    @pytest.mark.parametrize("algo", ["aes-256-gcm", "chacha20-poly1305"])
+    def test_stream_file(self, tmp_path, algo):
+        plain = tmp_path / "blob.bin"
+        plain.write_bytes(os.urandom((5 << 20) // 2))
+        enc_path, out_path = tmp_path / "blob.enc", tmp_path / "blob.out"
+        args = ["-p", "pw", "-a", algo, "-f", str(plain), "-o", str(enc_path)]
+        result = runner.invoke(app, ["encrypt", "enc", *args])
+        assert result.exit_code == 0
+        result = runner.invoke(app, ["encrypt", "dec", "-p", "pw", "-f", str(enc_path), "-o", str(out_path)])
+        assert result.exit_code == 0
+        assert out_path.read_bytes() == plain.read_bytes()
+
+    def test_stream_file_from_stdin(self, tmp_path):
+        plain = tmp_path / "blob.txt"
+        plain.write_text("streamed s3cret")
+        enc_path = tmp_path / "blob.enc"
+        result = runner.invoke(app, ["encrypt", "enc", "-p", "pw", "-f", str(plain), "-o", str(enc_path)])
+        assert result.exit_code == 0
+        result = runner.invoke(app, ["encrypt", "dec", "-p", "pw"], input=enc_path.read_bytes())
+        assert result.exit_code == 0
+        assert "streamed s3cret" in result.output
+
+    def test_mapped_file(self, tmp_path):
+        plain = tmp_path / "blob.bin"
+        plain.write_bytes(os.urandom(256 * 1024))
+        enc_path, out_path = tmp_path / "blob.enc", tmp_path / "blob.out"
+        args = ["-p", "pw", "-a", "fernet", "-f", str(plain), "-o", str(enc_path)]
+        result = runner.invoke(app, ["encrypt", "enc", *args])
+        assert result.exit_code == 0
+        result = runner.invoke(app, ["encrypt", "dec", "-p", "pw", "-f", str(enc_path), "-o", str(out_path)])
+        assert result.exit_code == 0
+        assert out_path.read_bytes() == plain.read_bytes()
+
+    def test_stream_truncated(self, tmp_path):
+        plain = tmp_path / "blob.bin"
+        plain.write_bytes(os.urandom(3 << 20))
+        enc_path, out_path = tmp_path / "blob.enc", tmp_path / "blob.out"
+        runner.invoke(app, ["encrypt", "enc", "-p", "pw", "-f", str(plain), "-o", str(enc_path)])
+        enc_path.write_bytes(enc_path.read_bytes()[: -(1 << 20) - 100])
+        result = runner.invoke(app, ["encrypt", "dec", "-p", "pw", "-f", str(enc_path), "-o", str(out_path)])
+        assert result.exit_code == 1
+        assert not out_path.exists()
+
+    def test_prompts_for_password(self, tmp_path):
+        enc_path = tmp_path / "data.enc"
+        result = runner.invoke(app, ["encrypt", "enc", "s3cret", "-o", str(enc_path)], input="pw\n")
+        assert result.exit_code == 0
+        result = runner.invoke(app, ["encrypt", "dec", "-p", "pw", "--file", str(enc_path)])
+        assert "s3cret" in result.output
+
+    def test_key_file(self, tmp_path):
+        key_path = tmp_path / "rex.key"
+        enc_path = tmp_path / "data.enc"
+        key_path.write_text("")
+        key_path.chmod(0o644)
+        result = runner.invoke(app, ["encrypt", "derive-key", "-p", "pw", "-o", str(key_path)])
+        assert result.exit_code == 0
+        assert key_path.stat().st_mode & 0o777 == 0o600
+        runner.invoke(app, ["encrypt", "enc", "s3cret", "--key-file", str(key_path), "-o", str(enc_path)])
+        result = runner.invoke(app, ["encrypt", "dec", "--key-file", str(key_path), "--file", str(enc_path)])
+        assert "s3cret" in result.output
+        # Still decryptable with the password the key was derived from
+        result = runner.invoke(app, ["encrypt", "dec", "-p", "pw", "--file", str(enc_path)])
+        assert "s3cret" in result.output
+
+    def test_binary_payload(self, tmp_path):
+        import base64
+        enc_path = tmp_path / "data.enc"
+        runner.invoke(app, ["encrypt", "enc", "s3cret", "-p", "pw", "-o", str(enc_path)])
+        blob = enc_path.read_bytes()
+        assert blob.startswith(b"REXE")
+        result = runner.invoke(app, ["encrypt", "dec", base64.b64encode(blob).decode(), "-p", "pw"])
+        assert result.exit_code == 0
+        assert "s3cret" in result.output
+
+    def test_dec_batch(self, tmp_path):
+        import base64
+        tokens = []
+        for i in range(3):
+            enc_path = tmp_path / f"{i}.enc"
+            runner.invoke(app, ["encrypt", "enc", f"value-{i}", "-p", "pw", "-o", str(enc_path)])
+            tokens.append(base64.b64encode(enc_path.read_bytes()).decode())
+        result = runner.invoke(app, ["encrypt", "dec-batch", "-p", "pw"], input=json.dumps(tokens))
+        assert result.exit_code == 0
+        assert all(f"value-{i}" in result.output for i in range(3))
+
+    def test_dec_batch_bad_row(self, tmp_path):
+        import base64
+        tokens = []
+        for i in range(2):
+            enc_path = tmp_path / f"{i}.enc"
+            runner.invoke(app, ["encrypt", "enc", f"value-{i}", "-p", "pw", "-o", str(enc_path)])
+            tokens.append(base64.b64encode(enc_path.read_bytes()).decode())
+        tokens.insert(1, "garbage")
+        result = runner.invoke(app, ["encrypt", "dec-batch", "-p", "pw"], input=json.dumps(tokens))
+        assert result.exit_code == 1
+        assert "value-0" in result.output
+        assert "value-1" in result.output
+        assert "Invalid encrypted data format" in result.output
+
+    def test_decrypt_legacy_pbkdf2(self):
+        import base64
+
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+        salt, nonce = os.urandom(16), os.urandom(12)
+        key = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=salt, iterations=480000).derive(b"pw")
+        payload = {
+            "alg": "aes-256-gcm",
+            "salt": base64.b64encode(salt).decode(),
+            "nonce": base64.b64encode(nonce).decode(),
+            "data": base64.b64encode(AESGCM(key).encrypt(nonce, b"legacy", None)).decode(),
+        }
+        token = base64.b64encode(json.dumps(payload).encode()).decode()
+        result = runner.invoke(app, ["encrypt", "dec", token, "-p", "pw"])
+        assert result.exit_code == 0
+        assert "legacy" in result.output
+        # The JSON payload is also accepted without its Base64 wrapper
+        result = runner.invoke(app, ["encrypt", "dec", "-p", "pw"], input=json.dumps(payload))
+        assert result.exit_code == 0
+        assert "legacy" in result.output
+
+    @pytest.mark.parametrize("kdf", [
+        {"name": "scrypt", "n": 3, "r": 8, "p": 1},
+        {"name": "scrypt", "n": 2**40, "r": 8, "p": 1},
+        {"name": "argon"},
+        "scrypt",
+    ])
+    def test_rejects_bad_kdf_parameters(self, kdf):
+        payload = {"alg": "aes-256-gcm", "salt": "AAAA", "nonce": "AAAAAAAAAAAAAAAA", "data": "AAAA", "kdf": kdf}
+        result = runner.invoke(app, ["encrypt", "dec", "-p", "pw"], input=json.dumps(payload))
+        assert result.exit_code == 1
+        assert "Invalid encrypted data format" in result.output
+
+    def test_stream_rejects_oversized_frame(self, tmp_path):
+        import struct
+        enc_path = tmp_path / "big.enc"
+        kdf = {"name": "scrypt", "n": 2**10, "r": 8, "p": 1}
+        header = {"alg": "aes-256-gcm", "kdf": kdf, "salt": "AAAA", "chunk": 16}
+        enc_path.write_bytes(json.dumps(header).encode() + b"\n" + struct.pack(">I12s", 1 << 30, bytes(12)))
+        result = runner.invoke(app, ["encrypt", "dec", "-p", "pw", "-f", str(enc_path)])
+        assert result.exit_code == 1
+        assert "Decryption failed" in result.output
+
 
 class TestJson:
     def test_beautify(self):
@@ -25,10 +219,33 @@ class TestJson:
         assert result.exit_code == 0
         assert '"a"' in result.output
 
+    def test_beautify_plain(self):
+        result = runner.invoke(app, ["json", "beautify", '{"a": "[bold]x[/bold]"}', "--no-highlight"])
+        assert result.exit_code == 0
+        assert "[bold]x[/bold]" in result.output
+
     def test_minify(self):
         result = runner.invoke(app, ["json", "minify", '{"a": 1, "b": 2}'])
         assert result.exit_code == 0
 
+    def test_minify_keeps_stdlib_extensions(self):
+        result = runner.invoke(app, ["json", "minify", '{"big": 123456789012345678901234567890, "n": NaN}'])
+        assert result.exit_code == 0
+        assert '{"big":123456789012345678901234567890,"n":NaN}' in result.output
+        result = runner.invoke(app, ["json", "minify", "[123456789012345678901234567890]"])
+        assert "[123456789012345678901234567890]" in result.output
+
+    @pytest.mark.parametrize("number", [2**63, -(2**63), -(2**63) - 1, 2**64, -(2**64)])
+    def test_minify_keeps_64_bit_boundary_integers(self, number):
+        result = runner.invoke(app, ["json", "minify", f"[{number}]"])
+        assert result.exit_code == 0
+        assert f"[{number}]" in result.output
+
+    def test_overflowing_numbers_stay_infinite(self):
+        result = runner.invoke(app, ["json", "minify", "[1e400, -1e400, 1.5]"])
+        assert result.exit_code == 0
+        assert "[Infinity,-Infinity,1.5]" in result.output
+
     def test_validate_valid(self):
         result = runner.invoke(app, ["json", "validate", '{"key": "value"}'])
         assert result.exit_code == 0
@@ -38,6 +255,51 @@ class TestJson:
         result = runner.invoke(app, ["json", "validate", '{invalid}'])
         assert result.exit_code == 1
 
+    @pytest.mark.parametrize("doc, detail", [
+        ('[1, 2, 3]', "3 items"),
+        ('"s"', "str"),
+        ("123456789012345678901234567890", "int"),
+    ])
+    def test_validate_detail(self, doc, detail):
+        result = runner.invoke(app, ["json", "validate", doc])
+        assert result.exit_code == 0
+        assert f"({detail})" in result.output
+
+    def test_validate_duplicate_keys(self):
+        result = runner.invoke(app, ["json", "validate", '{"a": 1, "a": 2, "b": 3}'])
+        assert result.exit_code == 0
+        assert "(2 keys)" in result.output
+
+    def test_minify_file_bytes(self, tmp_path):
+        src = tmp_path / "in.json"
+        src.write_bytes('{"name": "café", "n": 1}'.encode())
+        out_path = tmp_path / "out.json"
+        result = runner.invoke(app, ["json", "minify", "-f", str(src), "-o", str(out_path)])
+        assert result.exit_code == 0
+        assert json.loads(out_path.read_bytes()) == {"name": "café", "n": 1}
+
+    @pytest.mark.parametrize("expression, expected", [
+        ("results[0].id", "7"),
+        ("results[0].missing", "null"),
+        ("length(results)", "1"),
+    ])
+    def test_query(self, expression, expected):
+        pytest.importorskip("jmespath")
+        doc = '{"results": [{"id": 7, "tags": ["a", "b"]}], "meta": {"count": 1}}'
+        result = runner.invoke(app, ["json", "query", expression, "--data", doc])
+        assert result.exit_code == 0
+        assert expected in result.output
+
+    @pytest.mark.parametrize("expression, doc, expected", [
+        ("a", '{"a": 1, "a": 2}', "2"),
+        ("a.b", '{"a": {"b": 1}, "a": {"c": 2}}', "null"),
+    ])
+    def test_query_duplicate_keys(self, expression, doc, expected):
+        pytest.importorskip("jmespath")
+        result = runner.invoke(app, ["json", "query", expression, "--data", doc])
+        assert result.exit_code == 0
+        assert expected in result.output
+
 
 class TestYaml:
     def test_validate(self):
@@ -49,6 +311,98 @@ class TestYaml:
         result = runner.invoke(app, ["yaml", "to-json", "name: rex\nversion: 1"])
         assert result.exit_code == 0
 
+    @pytest.mark.parametrize("doc", [
+        b'{"a": [1, 2.5, true, null, "x"]}',
+        b"[NaN, .inf]",
+        b"{a: 1}",
+        b"[1, 2] # c",
+        b"key: v",
+    ])
+    def test_load_json_fast_path(self, doc):
+        import yaml
+
+        from rex.commands.yaml_cmd import _load
+
+        assert _load(doc) == yaml.safe_load(doc)
+
+    def test_load_exponents(self):
+        from rex.commands.yaml_cmd import _load
+        assert _load(b'{"a": 1e3, "b": 1.5e+3}') == {"a": "1e3", "b": 1500.0}
+
+    @pytest.mark.parametrize("doc", [
+        b'\t{"a": 1}',
+        b'{\n\t"a": 1\n}',
+        b"[-9223372036854775809, 18446744073709551616]",
+        '["a\u0085b"]'.encode(),
+        b'["\\ud83d\\ude00"]',
+        b'["a\x7fb"]',
+        '["a\ufffeb"]'.encode(),
+        b"[1e3, 2E-5]",
+    ], ids=["leading-tab", "tab-indent", "long-int", "nel", "surrogates", "del", "noncharacter", "exponent"])
+    def test_load_matches_yaml_loader(self, doc):
+        import yaml
+
+        from rex.commands.yaml_cmd import SafeLoader, _load
+
+        try:
+            expected = yaml.load(doc, Loader=SafeLoader)
+        except yaml.YAMLError:
+            with pytest.raises(yaml.YAMLError):
+                _load(doc)
+        else:
+            assert _load(doc) == expected
+
+    def test_to_json_non_finite(self, tmp_path):
+        out_path = tmp_path / "out.json"
+        result = runner.invoke(app, ["yaml", "to-json", "a: .nan\nb: -.inf\n1: x", "-o", str(out_path)])
+        assert result.exit_code == 0
+        assert out_path.read_text().split() == ["{", '"a":', "NaN,", '"b":', "-Infinity,", '"1":', '"x"', "}"]
+
+    def test_to_yaml(self, tmp_path):
+        out_path = tmp_path / "out.yaml"
+        result = runner.invoke(app, ["yaml", "to-yaml", '{"name": "café", "tags": ["a", "b"]}', "-o", str(out_path)])
+        assert result.exit_code == 0
+        assert out_path.read_text(encoding="utf-8") == "name: café\ntags:\n- a\n- b\n"
+
+    def test_lint_multi_document(self, tmp_path):
+        src = tmp_path / "multi.yaml"
+        src.write_text("a: 1\n---\nb: 2\n---\n- c\n")
+        result = runner.invoke(app, ["yaml", "lint", str(src)])
+        assert result.exit_code == 0
+        assert "3 document(s)" in result.output
+
+    def test_lint_strict_warnings(self, tmp_path):
+        src = tmp_path / "ws.yaml"
+        src.write_text("a: 1 \nb:\t2\n   \nc: 3\t\n")
+        result = runner.invoke(app, ["yaml", "lint", str(src), "--strict"])
+        assert result.exit_code == 0
+        assert "4 warning(s)" in result.output
+        for warning in ("Line 1: Trailing", "Line 2: Tab", "Line 4: Tab", "Line 4: Trailing"):
+            assert warning in result.output
+
+    def test_lint_warnings_need_strict(self, tmp_path):
+        src = tmp_path / "ws.yaml"
+        src.write_text("a: 1 \n")
+        result = runner.invoke(app, ["yaml", "lint", str(src)])
+        assert result.exit_code == 0
+        assert "Valid YAML (1 document(s))" in result.output
+        assert "warning" not in result.output
+
+    def test_lint_crlf(self, tmp_path):
+        src = tmp_path / "crlf.yaml"
+        src.write_bytes(b"a: 1\r\nb: 2 \r\n")
+        result = runner.invoke(app, ["yaml", "lint", str(src), "--strict"])
+        assert result.exit_code == 0
+        assert "1 warning(s)" in result.output
+        assert "Line 2: Trailing" in result.output
+
+    def test_lint_error(self, tmp_path):
+        bad = tmp_path / "bad.yaml"
+        bad.write_text("a: 1\nb: [2, 3\n")
+        result = runner.invoke(app, ["yaml", "lint", str(bad)])
+        assert result.exit_code == 1
+        assert "Line 3" in result.output
+
 
 class TestPassword:
     def test_generate(self):
@@ -60,10 +414,33 @@ class TestPassword:
         result = runner.invoke(app, ["password", "generate", "--count", "5"])
         assert result.exit_code == 0
 
+    def test_generate_exclude(self):
+        result = runner.invoke(app, [
+            "password", "generate", "--no-uppercase", "--no-lowercase", "--no-symbols",
+            "--exclude", "012345678", "--length", "12",
+        ])
+        assert result.exit_code == 0
+        assert "999999999999" in result.output
+
+    def test_random_indices(self):
+        from rex.commands.password_cmd import _random_indices
+        for size in (1, 10, 64, 88, 640):
+            picks = _random_indices(20000, size)
+            assert len(picks) == 20000
+            assert set(picks) == set(range(size))
+
     def test_passphrase(self):
         result = runner.invoke(app, ["password", "passphrase"])
         assert result.exit_code == 0
 
+    def test_passphrase_count(self):
+        from rex.commands.password_cmd import WORDLIST
+        result = runner.invoke(app, ["password", "passphrase", "-w", "3", "-n", "4", "-s", "+"])
+        assert result.exit_code == 0
+        phrases = [line.split()[3] for line in result.output.splitlines() if "+" in line]
+        assert len(phrases) == 4
+        assert all(word in WORDLIST for phrase in phrases for word in phrase.split("+"))
+
 
 class TestCron:
     def test_explain(self):
@@ -71,6 +448,34 @@ class TestCron:
         assert result.exit_code == 0
         assert "Minute" in result.output
 
+    def test_explain_batch(self):
+        crontab = "# nightly\n0 2 * * * /usr/bin/backup\n@reboot\n*/5 * * * 1-5\n"
+        result = runner.invoke(app, ["cron", "explain-batch"], input=crontab)
+        assert result.exit_code == 0
+        assert "At 2:00" in result.output
+        assert "Monday through Friday" in result.output
+        assert "system startup" in result.output
+
+        result = runner.invoke(app, ["cron", "explain-batch"], input="0 2 *\n")
+        assert result.exit_code == 1
+
+    def test_explain_batch_skips_environment_lines(self):
+        crontab = "SHELL=/bin/bash\nMAILTO = ops@example.com\n0 2 * * * /usr/bin/backup\n"
+        result = runner.invoke(app, ["cron", "explain-batch"], input=crontab)
+        assert result.exit_code == 0
+        assert "At 2:00" in result.output
+        assert "Expected 5 fields" not in result.output
+
+    @pytest.mark.parametrize("dow, summary", [
+        ("1-3,5-6", "Wednesday, Friday through"),
+        ("1-2-3", "on 1-2-3"),
+    ])
+    def test_explain_batch_day_of_week(self, dow, summary):
+        result = runner.invoke(app, ["cron", "explain-batch"], input=f"0 9 * * {dow}\n0 2 * * *\n")
+        assert result.exit_code == 0
+        assert summary in result.output
+        assert "At 2:00" in result.output
+
     def test_presets(self):
         result = runner.invoke(app, ["cron", "presets"])
         assert result.exit_code == 0
@@ -92,6 +497,12 @@ class TestHash:
         assert "MD5" in result.output
         assert "SHA256" in result.output
 
+    def test_raw(self):
+        import hashlib
+        result = runner.invoke(app, ["hash", "generate", "hello", "--raw"])
+        assert result.exit_code == 0
+        assert result.output == hashlib.sha256(b"hello").hexdigest() + "\n"
+
     def test_verify_correct(self):
         import hashlib
         expected = hashlib.sha256(b"test").hexdigest()
@@ -99,6 +510,56 @@ class TestHash:
         assert result.exit_code == 0
         assert "matches" in result.output
 
+    def test_verify_mismatch(self):
+        result = runner.invoke(app, ["hash", "verify", "test", "--expected", "not-hex"])
+        assert result.exit_code == 1
+        assert "mismatch" in result.output
+
+    def test_verify_whitespace(self):
+        import hashlib
+        digest = hashlib.sha256(b"test").hexdigest()
+        result = runner.invoke(app, ["hash", "verify", "test", "--expected", f" {digest}\n"])
+        assert result.exit_code == 0
+        result = runner.invoke(app, ["hash", "verify", "test", "--expected", f"{digest[:8]} {digest[8:]}"])
+        assert result.exit_code == 1
+
+    def test_file(self, tmp_path):
+        import hashlib
+        path = tmp_path / "blob.bin"
+        path.write_bytes(b"rex" * 500_000)
+        result = runner.invoke(app, ["hash", "generate", "--file", str(path)])
+        assert result.exit_code == 0
+        assert hashlib.sha256(path.read_bytes()).hexdigest() in result.output
+
+    def test_file_all_algorithms(self, tmp_path):
+        import hashlib
+        path = tmp_path / "blob.bin"
+        path.write_bytes(os.urandom((5 << 20) // 2))
+        result = runner.invoke(app, ["hash", "generate", "--file", str(path), "--all"])
+        assert result.exit_code == 0
+        assert hashlib.md5(path.read_bytes()).hexdigest() in result.output
+        assert hashlib.sha1(path.read_bytes()).hexdigest() in result.output
+
+    def test_hmac(self):
+        import hmac
+        expected = hmac.new(b"secret", b"hello", "sha256").hexdigest()
+        result = runner.invoke(app, ["hash", "hmac", "hello", "--key", "secret"])
+        assert result.exit_code == 0
+        assert expected in result.output
+        result = runner.invoke(app, ["hash", "hmac", "hello", "--key", "secret", "--expected", expected.upper()])
+        assert result.exit_code == 0
+
+    def test_hmac_native_blake2(self):
+        import hashlib
+        expected = hashlib.blake2s(b"hello", key=b"secret").hexdigest()
+        result = runner.invoke(app, ["hash", "hmac", "hello", "--key", "secret", "--algo", "blake2s", "--native"])
+        assert result.exit_code == 0
+        assert expected in result.output
+        result = runner.invoke(app, ["hash", "hmac", "hello", "--key", "x" * 33, "--algo", "blake2s", "--native"])
+        assert result.exit_code == 1
+        result = runner.invoke(app, ["hash", "hmac", "hello", "--key", "secret", "--native"])
+        assert result.exit_code == 1
+
 
 class TestBase64:
     def test_encode(self):
@@ -111,6 +572,21 @@ class TestBase64:
         assert result.exit_code == 0
         assert "hello world" in result.output
 
+    def test_raw(self):
+        result = runner.invoke(app, ["base64", "encode", "hello world", "--raw"])
+        assert result.output == "aGVsbG8gd29ybGQ=\n"
+        result = runner.invoke(app, ["base64", "decode", "aGVsbG8gd29ybGQ=", "--raw"])
+        assert result.stdout_bytes == b"hello world"
+
+    def test_encode_file_stream(self, tmp_path):
+        import base64
+        plain = tmp_path / "blob.bin"
+        plain.write_bytes(os.urandom((7 << 20) + 1))
+        out_path = tmp_path / "blob.b64"
+        result = runner.invoke(app, ["base64", "encode", "-f", str(plain), "-o", str(out_path)])
+        assert result.exit_code == 0
+        assert out_path.read_bytes() == base64.b64encode(plain.read_bytes())
+
 
 class TestUuid:
     def test_generate_v4(self):
@@ -125,6 +601,109 @@ class TestUuid:
         result = runner.invoke(app, ["uuid", "generate", "--count", "3"])
         assert result.exit_code == 0
 
+    def test_generate_negative_count(self):
+        result = runner.invoke(app, ["uuid", "generate", "--count", "-1"])
+        assert result.exit_code == 0
+
+    def test_uuid4_batch(self):
+        import uuid
+
+        from rex.commands.uuid_cmd import _uuid4_batch
+
+        uids = _uuid4_batch(200)
+        assert len(set(uids)) == 200
+        for uid in uids:
+            parsed = uuid.UUID(uid)
+            assert str(parsed) == uid
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+
+
+class TestCert:
+    def test_expiry_bulk_unreachable(self):
+        import socket
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        result = runner.invoke(app, ["cert", "expiry-bulk", f"127.0.0.1:{port}", "--timeout", "1"])
+        assert result.exit_code == 2
+        assert "CRITICAL" in result.output
+
+    def test_parse_cert_time(self):
+        from datetime import datetime, timezone
+
+        from rex.commands.cert_cmd import _parse_cert_time
+
+        for value in ("Jun  1 08:05:09 2026 GMT", "Dec 31 23:59:59 2030 GMT"):
+            expected = datetime.strptime(value, "%b %d %H:%M:%S %Y %Z").replace(tzinfo=timezone.utc)
+            assert _parse_cert_time(value) == expected
+
+
+class TestNetwork:
+    def test_port_check(self):
+        import socket
+        with socket.socket() as listener, socket.socket() as closed:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+            closed.bind(("127.0.0.1", 0))
+            open_port, closed_port = listener.getsockname()[1], closed.getsockname()[1]
+            result = runner.invoke(app, ["net", "port", "127.0.0.1", f"{open_port},{closed_port}", "-t", "1"])
+        assert result.exit_code == 0
+        assert "OPEN" in result.output
+        assert "CLOSED" in result.output
+
+    def test_port_check_prefers_ipv4(self, monkeypatch):
+        import socket
+        real_getaddrinfo = socket.getaddrinfo
+
+        def v6_first(host, *args, **kwargs):
+            v4 = real_getaddrinfo("127.0.0.1", *args, **kwargs)
+            return [(socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("::1", 0, 0, 0))] + v4
+
+        monkeypatch.setattr(socket, "getaddrinfo", v6_first)
+        with socket.socket() as listener:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+            port = listener.getsockname()[1]
+            result = runner.invoke(app, ["net", "port", "localhost", str(port), "-t", "1"])
+        assert result.exit_code == 0
+        assert "OPEN" in result.output
+
+    def test_port_check_socket_error(self, monkeypatch):
+        import errno
+        import socket
+
+        def no_descriptors(*args, **kwargs):
+            raise OSError(errno.EMFILE, "Too many open files")
+
+        monkeypatch.setattr(socket, "socket", no_descriptors)
+        result = runner.invoke(app, ["net", "port", "127.0.0.1", "80"])
+        assert result.exit_code == 0
+        assert "ERROR" in result.output
+        assert "CLOSED" not in result.output
+
+    def test_service_name(self):
+        import socket
+
+        from rex.commands.network_cmd import _service_name
+
+        for port in (22, 80, 443):
+            try:
+                expected = socket.getservbyport(port, "tcp")
+            except OSError:
+                continue
+            assert _service_name(port) == expected
+        assert _service_name(1) in ("tcpmux", "unknown")
+
+    def test_parse_ports(self):
+        from rex.commands.network_cmd import _parse_ports
+        assert _parse_ports("443, 80,80-82") == [80, 81, 82, 443]
+
+    @pytest.mark.parametrize("bad", ["0", "70000", "90-80", "http", "1-2-3"])
+    def test_parse_ports_rejects(self, bad):
+        result = runner.invoke(app, ["net", "port", "127.0.0.1", bad])
+        assert result.exit_code == 1
+
 
 class TestJwt:
     def test_decode(self):
@@ -133,3 +712,15 @@ class TestJwt:
         result = runner.invoke(app, ["jwt", "decode", token])
         assert result.exit_code == 0
         assert "Rex" in result.output
+
+    def test_decode_times(self):
+        import base64
+
+        def segment(obj):
+            return base64.urlsafe_b64encode(json.dumps(obj).encode()).rstrip(b"=").decode()
+
+        token = f"{segment({'alg': 'none'})}.{segment({'iat': 1516239022, 'exp': 1516239022})}."
+        result = runner.invoke(app, ["jwt", "decode", token])
+        assert result.exit_code == 0
+        assert "2018-01-18 01:30:22 UTC" in result.output
+        assert "EXPIRED" in result.output